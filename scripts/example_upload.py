@@ -1,21 +1,36 @@
+from collections import defaultdict, deque
+from itertools import chain, islice
 from pathlib import Path
-import psycopg
 import gzip
-import orjson
-import tqdm
+import io
 import logging
-from isal import igzip_threaded
-import time
-from openalex_types.works import Work
+import queue
 import time
-import psycopg
-import orjson
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import msgspec
 import tqdm
-from concurrent.futures import ThreadPoolExecutor
 from psycopg_pool import ConnectionPool
+
+from openalex_types.common import iter_sql_rows, unnest_params
+from openalex_types.data import READ_BUFFER_SIZE, SnapshotGZ, read_lines_parallel
+from openalex_types.ingest import Work
+
 logger = logging.getLogger("openalex-types.works")
 logger.setLevel(logging.DEBUG)
 data_dir = Path(".").absolute().parent.joinpath("openalex-snapshot", "data")
+# works accumulated before a flush (one COPY per table per flush)
+BATCH_SIZE = 1000
+# parser processes, writer threads (one connection each) and parsed chunks
+# allowed to wait for a writer before parsing blocks
+PARSERS = 8
+WRITERS = 4
+QUEUE_SIZE = 2 * WRITERS
+# "copy" for first-time loads, "unnest" (one INSERT per table per flush) or
+# "insert" (prepared INSERTs per row) for tables with data
+LOAD_MODE = "copy"
+
+
 def get_parent_dirs(s: str) -> list[str]:
     dir_ = data_dir.joinpath(s)
     l = list(dir_.glob("updated_date*"))
@@ -26,49 +41,174 @@ def get_content_gz(parent_dir: str | Path) -> list[str]:
     return l
 
 def gz_to_lines(gz_file: str | Path) -> list[dict]:
-    with gzip.open(gz_file, "rb") as f:
+    with io.BufferedReader(gzip.open(gz_file, "rb"), buffer_size=READ_BUFFER_SIZE) as f:
         lines = f.readlines()
     return lines
-work_files = get_content_gz(get_parent_dirs("works")[0])
-with igzip_threaded.open(work_files[3], "rb") as f:
-    work_lines1 = f.readlines()
-wks = work_lines1
-pool = ConnectionPool("dbname=db user=user port=5432 host=localhost password=password")
-
-def process_work_item(work_item):
-    with pool.connection() as conn:
+# msgspec mirror of Work, decoded straight from bytes (no dict, no Pydantic)
+WORK_DECODER = msgspec.json.Decoder(Work)
+
+
+def parse_work_item(work_item: bytes) -> list[tuple[str, tuple, tuple]]:
+    """Parse a Work line into (table, statements, values) rows, subtables included.
+
+    statements is (columns, insert, unnest, unnest json columns) of the table.
+    """
+    try:
+        work_ = WORK_DECODER.decode(work_item)
+        return [(t._sql_table_name,
+                 (t.sql_columns, t.sql_insert, t.sql_unnest, t._sql_unnest_json),
+                 values)
+                for t, values in iter_sql_rows(work_)]
+    except Exception as e:
+        print(f"Parse failed: {e}")
+        return []
+
+
+def copy_rows(cur, table: str, columns: str, rows: list[tuple]):
+    """Stream rows into table with a single COPY FROM STDIN."""
+    with cur.copy(f"COPY {table} {columns} FROM STDIN") as cp:
+        for row in rows:
+            cp.write_row(row)
+
+
+def group_chunk(chunk: list[list[tuple]]) -> tuple[dict[str, list[tuple]], dict[str, tuple]]:
+    """Group the chunk's rows by table, with the statements of each table."""
+    buffers: dict[str, list[tuple]] = defaultdict(list)
+    statements: dict[str, tuple] = {}
+    for rows in chunk:
+        for table, stmts, values in rows:
+            statements[table] = stmts
+            buffers[table].append(values)
+    return buffers, statements
+
+
+def copy_chunk(cur, chunk: list[list[tuple]]):
+    """Group the chunk's rows by table and COPY each table once."""
+    buffers, statements = group_chunk(chunk)
+    for table, table_rows in buffers.items():
+        copy_rows(cur, table, statements[table][0], table_rows)
+
+
+def unnest_chunk(cur, chunk: list[list[tuple]]):
+    """INSERT each table's rows of the chunk at once, as one array per column.
+
+    The statement text does not depend on the number of rows, so it is
+    parsed (and prepared) once per table.
+    """
+    buffers, statements = group_chunk(chunk)
+    for table, table_rows in buffers.items():
+        _, _, unnest, json_columns = statements[table]
+        cur.execute(unnest, unnest_params(table_rows, json_columns), prepare=True)
+
+
+def insert_chunk(conn, cur, chunk: list[list[tuple]]):
+    """Insert the chunk with prepared statements, pipelined.
+
+    Every Work (parent + subtables) runs in its own savepoint, so a failure
+    only rolls back that Work.
+    """
+    with conn.pipeline():
+        for rows in chunk:
+            try:
+                with conn.transaction():
+                    for _, (_, insert, _, _), values in rows:
+                        cur.execute(insert, values, prepare=True)
+            except Exception as e:
+                print(f"Query failed for {rows[0][2][0]}: {e}")
+
+
+def flush(conn, cur, chunk: list[list[tuple]]):
+    """Write the chunk and commit once for all of it."""
+    try:
+        if LOAD_MODE == "copy":
+            copy_chunk(cur, chunk)
+        elif LOAD_MODE == "unnest":
+            unnest_chunk(cur, chunk)
+        else:
+            insert_chunk(conn, cur, chunk)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"Query failed: {e}")
+    chunk.clear()
+
+
+def parse_chunk(lines: list[bytes]) -> list[list[tuple]]:
+    """Parse a chunk of lines, run in a parser process."""
+    return [rows for rows in map(parse_work_item, lines) if rows]
+
+
+def write_chunks(pool: ConnectionPool, chunks: queue.Queue):
+    """Write parsed chunks from the queue until a None sentinel.
+
+    The writer keeps one connection and one cursor for its whole life, and
+    commits once per chunk (BATCH_SIZE works), not once per checkout.
+    """
+    with pool.connection() as conn, conn.cursor() as cur:
+        while (chunk := chunks.get()) is not None:
+            flush(conn, cur, chunk)
+
+
+def put_chunk(chunks: queue.Queue, chunk, writer_futures: list):
+    """Put chunk on the queue, raise if a writer died instead of blocking for good."""
+    while True:
+        for future in writer_futures:
+            if future.done():
+                future.result()  # raises the writer's error
+                raise RuntimeError("A writer exited before its sentinel")
         try:
-            with conn.cursor() as cur:
-                try:
-                    work_ = Work(**(orjson.loads(work_item)))
-                    cur.execute(
-                        f"INSERT INTO {work_._sql_table_name} {work_.sql_columns} VALUES {work_.sql_values}")
-                    
-                    for subtable in work_._sql_subtables:
-                        try:
-                            attr_ = getattr(work_, subtable)
-                            if attr_ is None:
-                                continue
-                            if isinstance(attr_, list):
-                                for a in attr_:
-                                    cur.execute(
-                                        f"INSERT INTO {a._sql_table_name} {a.sql_columns} VALUES {a.sql_values}")
-                            else:
-                                cur.execute(
-                                    f"INSERT INTO {attr_._sql_table_name} {attr_.sql_columns} VALUES {attr_.sql_values}")
-                        except Exception as e:
-                            print(f"Error with {subtable}: {e}")
-                            raise e
-                    
-                    conn.commit()
-                except Exception as e:
-                    print(f"Error with {work_.id}: {e}")
-                    raise e
-        except Exception as e:
-            print(f"Query failed: {e}")
-
-start_time = time.time()
-
-# Use ThreadPoolExecutor for multi-threading
-with ThreadPoolExecutor(max_workers=10) as executor:
-    list(tqdm.tqdm(executor.map(process_work_item, wks), total=len(wks)))
\ No newline at end of file
+            chunks.put(chunk, timeout=1)  # blocks while the writers are behind
+            return
+        except queue.Full:
+            continue
+
+
+def stop_writers(chunks: queue.Queue, writer_futures: list):
+    """Send one None sentinel per writer, unless all of them already exited."""
+    for _ in writer_futures:
+        while not all(future.done() for future in writer_futures):
+            try:
+                chunks.put(None, timeout=1)
+                break
+            except queue.Full:
+                continue
+
+
+def main():
+    start_time = time.time()
+    work_files = get_content_gz(get_parent_dirs("works")[0])
+    # files inflated concurrently, their lines streamed in file order
+    wks = chain.from_iterable(read_lines_parallel([SnapshotGZ(f) for f in work_files]))
+    pool = ConnectionPool("dbname=db user=user port=5432 host=localhost password=password",
+                          min_size=WRITERS, max_size=WRITERS)
+    # Parsing (CPU-bound, processes) overlaps with writing (I/O-bound, threads)
+    chunks: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+    progress = tqdm.tqdm()
+    with ProcessPoolExecutor(max_workers=PARSERS) as parsers, \
+            ThreadPoolExecutor(max_workers=WRITERS) as writers:
+        writer_futures = [writers.submit(write_chunks, pool, chunks)
+                          for _ in range(WRITERS)]
+        pending: deque = deque()
+        try:
+            while lines := list(islice(wks, BATCH_SIZE)):
+                pending.append(parsers.submit(parse_chunk, lines))
+                if len(pending) >= PARSERS:
+                    chunk = pending.popleft().result()
+                    progress.update(len(chunk))
+                    put_chunk(chunks, chunk, writer_futures)
+            while pending:
+                chunk = pending.popleft().result()
+                progress.update(len(chunk))
+                put_chunk(chunks, chunk, writer_futures)
+        finally:
+            # without sentinels the writers never leave chunks.get(), and
+            # the executor's shutdown would wait on them forever
+            stop_writers(chunks, writer_futures)
+        for future in writer_futures:
+            future.result()
+    pool.close()
+    print(f"Done in {time.time() - start_time:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from openalex_types.common import (
     BaseCountByYear,
     Date8601,
     DateTimeNoTZ,
+    fetch_subtables,
     OpenAlexObject,
     SummaryStats,
     SQLTable,
@@ -60,8 +61,10 @@ SQL_TABLES_TO_CLASSES = {
 }
 # which tables have multiple values (list)?
 MULTIVALUE = ["counts_by_year"]
+# column order of each subtable, looked up once at import
+_SUBTABLE_ORDERS = {k: v._sql_order_tuple for k, v in SQL_TABLES_TO_CLASSES.items()}
 
-class Author(OpenAlexObject, SQLTable):
+class Author(OpenAlexObject, SQLTable, frozen=True):
     """OpenAlex Authors."""
     orcid: Optional[str] = None
     display_name: Optional[str] = None
@@ -114,40 +117,24 @@ class Author(OpenAlexObject, SQLTable):
     def from_sql(t: tuple, conn: Optional[Connection] = None,
                  subtables: Optional[dict] = None) -> "Author":
         """Create Author from SQL."""
-        args = dict(zip(Author._sql_order.default, t))  # type: ignore
+        args = dict(zip(Author._sql_order_tuple, t))  # type: ignore
         if conn is None:
             if subtables is None:  # only Author object
                 return Author(**args)
             else:  # Author object with subtables already queried
-                for subtable in Author._sql_subtables.default:  # type: ignore
+                for subtable in Author._sql_subtables_tuple:  # type: ignore
                     if subtable in subtables:
                         if subtable in MULTIVALUE:
                             args[subtable] = [dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, t)  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], t)
                             )
                                 for t in subtables[subtable]]
                         else:
                             args[subtable] = dict(
-                                zip(SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, subtables[subtable])  # type: ignore
+                                zip(_SUBTABLE_ORDERS[subtable], subtables[subtable])
                             )
             return Author(**args)
         else:  # Query everything, connection is provided
-            id_ = t[0]
-            with conn.cursor() as cursor:
-                for subtable in Author._sql_subtables.default:  # type: ignore
-                    subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
-                    if subtable in MULTIVALUE:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE author_id = %s", (id_,))  # type: ignore
-                        list_ = [dict(zip(subtable_cls._sql_order.default, t))  # type: ignore
-                                 for t in cursor.fetchall()]
-                        if len(list_) > 0:
-                            args[subtable] = list_
-                    else:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE author_id = %s", (id_,))  # type: ignore
-                        t = cursor.fetchone()
-                        if t is not None:
-                            args[subtable] = dict(
-                                zip(subtable_cls._sql_order.default, t))  # type: ignore
+            args.update(fetch_subtables(
+                conn, "author_id", t[0], SQL_TABLES_TO_CLASSES, MULTIVALUE))
             return Author(**args)
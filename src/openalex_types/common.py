@@ -2,11 +2,18 @@
 # pylint: disable=W1203, E1101, W0212
 import logging
 from datetime import datetime
-from typing import Literal, Optional
+from functools import lru_cache
+from types import UnionType
+from typing import Iterator, Literal, Optional, Union, get_args, get_origin, get_type_hints
 
+import numpy as np
 import orjson
 import pandas as pd  # type: ignore
-from pydantic import AliasChoices, BaseModel, Field
+import pyarrow as pa  # type: ignore
+from psycopg import Connection
+from psycopg.rows import dict_row
+from pydantic import AliasChoices, AnyUrl, BaseModel, Field
+from pydantic.fields import ModelPrivateAttr
 from pydantic.functional_validators import AfterValidator
 from typing_extensions import Annotated
 
@@ -20,18 +27,14 @@ console_handler.setFormatter(formatter)
 logger.addHandler(console_handler)
 
 
-def no_tz(dt: datetime) -> str:
+def no_tz(dt: datetime) -> datetime:
     """Make sure no time zone is present in the datetime."""
-    return datetime.fromisoformat(dt.strftime("%Y-%m-%d %H:%M:%S")).isoformat(sep="T")
-
-
-def check_8601(dt: datetime) -> str:
-    """Check ISO 8601 format."""
-    return dt.isoformat()
+    return dt.replace(tzinfo=None, microsecond=0)
 
 
 DateTimeNoTZ = Annotated[datetime, AfterValidator(no_tz)]
-Date8601 = Annotated[datetime, AfterValidator(check_8601)]
+# kept as given, time zone included
+Date8601 = datetime
 
 CountryCode = Annotated[str, Field(..., min_length=2, max_length=2)]
 
@@ -41,9 +44,32 @@ class OpenAlexObject(BaseModel):
     id: str
 
 
+def _class_default(cls: type, name: str, default=None):
+    """Class-level value of `name`, unwrapping Pydantic private attributes."""
+    value = getattr(cls, name, default)
+    if isinstance(value, ModelPrivateAttr):
+        return value.default
+    return value
+
+
 class SQLTable:
     """Classes that represent SQL tables."""
+    # no instance __dict__ from the mixin, keeps slotted subclasses slotted
+    __slots__ = ()
     _sql_order: list[str]
+    # bound once per class in `__init_subclass__`, plain class attributes
+    _sql_order_tuple: tuple[str, ...] = ()
+    _sql_subtables_tuple: tuple[str, ...] = ()
+    _sql_columns_str: str = "()"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        order = _class_default(cls, "_sql_order")
+        if order is None:
+            return
+        cls._sql_order_tuple = tuple(order)
+        cls._sql_subtables_tuple = tuple(_class_default(cls, "_sql_subtables", []))
+        cls._sql_columns_str = "(" + ", ".join(order) + ")"
 
     def _get_arg(self, arg_name: str) -> str:
         """Get arg_name if it exists."""
@@ -51,6 +77,11 @@ class SQLTable:
             arg = getattr(self, arg_name)
             if arg is None:
                 return "NULL"
+            if isinstance(arg, np.ndarray):
+                # pgvector literal, str() of an array is numpy's summary
+                if arg.size == 0:
+                    return "NULL"
+                return "'[" + ",".join(map(str, arg.tolist())) + "]'"
             if isinstance(arg, list):
                 if len(arg) == 0:
                     return "NULL"
@@ -64,6 +95,8 @@ class SQLTable:
                 return str(arg).upper()
             if isinstance(arg, (int, float)):
                 return str(arg)
+            if isinstance(arg, BaseModel):
+                arg = arg.model_dump(mode="json")
             if isinstance(arg, dict):
                 s = orjson.dumps(arg).decode().replace("'", "''")
                 return f"'{s}'"
@@ -76,45 +109,262 @@ class SQLTable:
     @property
     def sql_columns(self) -> str:
         """SQL string for columns."""
-        return "(" + ", ".join(self._sql_order) + ")"
+        return self._sql_columns_str
+
+    @property
+    def sql_insert(self) -> str:
+        """Parameterized SQL string for INSERT, values bound by the driver."""
+        placeholders = ", ".join(["%s"] * len(self._sql_order_tuple))
+        return f"INSERT INTO {self._sql_table_name} {self.sql_columns} VALUES ({placeholders})"
 
     @property
     def sql_values(self) -> str:
         """SQL string for INSERT."""
-        return "(" + ", ".join([self._get_arg(k) for k in self._sql_order]) + ")"
+        return "(" + ", ".join([self._get_arg(k) for k in self._sql_order_tuple]) + ")"
+
+    @property
+    def sql_unnest(self) -> str:
+        """Parameterized SQL string to INSERT a batch, one array per column.
+
+        Bind the result of `unnest_params`, the statement text is the same
+        for any number of rows.
+        """
+        if "_sql_unnest_str" not in type(self).__dict__:
+            type(self)._compile_unnest()
+        return self._sql_unnest_str
+
+    @classmethod
+    def _compile_unnest(cls):
+        """Build `_sql_unnest_str` and `_sql_unnest_json` from the annotations.
+
+        `unnest` would flatten array columns, those travel as jsonb and are
+        turned back into arrays in the SELECT. Columns whose annotation
+        does not give their SQL type are listed in `_sql_types`.
+        """
+        try:
+            hints = get_type_hints(cls)
+        except Exception:  # pylint: disable=broad-except
+            hints = {}
+        sql_types = _class_default(cls, "_sql_types") or {}
+        params, selects, json_columns = [], [], []
+        for i, key in enumerate(cls._sql_order_tuple):
+            pg_type = sql_types.get(key) or _pg_type(hints.get(key))
+            if pg_type.endswith("[]"):
+                json_columns.append(i)
+                params.append("%s::jsonb[]")
+                element = f"jsonb_array_elements_text(c{i})::{pg_type[:-2]}"
+                selects.append(
+                    f"CASE WHEN c{i} IS NULL THEN NULL ELSE ARRAY(SELECT {element}) END")
+            else:
+                params.append(f"%s::{pg_type}[]")
+                selects.append(f"c{i}")
+        aliases = ", ".join(f"c{i}" for i in range(len(params)))
+        cls._sql_unnest_str = (f"INSERT INTO {_class_default(cls, '_sql_table_name')} "
+                               f"{cls._sql_columns_str} SELECT {', '.join(selects)} "
+                               f"FROM unnest({', '.join(params)}) AS u({aliases})")
+        cls._sql_unnest_json = tuple(json_columns)
 
     def to_sql_values(self) -> tuple:
         """Return a tuple of values for parameterized SQL queries."""
-        values = []
-        for key in self._sql_order:
-            value = getattr(self, key, None)
-            # Convert dictionaries to JSON strings for asyncpg
-            if isinstance(value, dict):
-                value = orjson.dumps(value).decode()
-            # Convert ISO datetime strings back to datetime objects for PostgreSQL
-            elif isinstance(value, str) and value and len(value) >= 10:
-                # Check if it looks like an ISO datetime string
-                if value[4] == '-' and value[7] == '-':
-                    try:
-                        # Try to parse as datetime
-                        if 'T' in value or ' ' in value:
-                            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                        # If it's just a date, parse as date
-                        else:
-                            value = datetime.fromisoformat(value + 'T00:00:00')
-                    except (ValueError, AttributeError):
-                        # If parsing fails, keep as string
-                        pass
-            values.append(value)
-        return tuple(values)
+        fast = type(self).__dict__.get("_fast_to_sql_values")
+        if fast is None:
+            fast = type(self)._compile_to_sql_values()
+        return fast(self)
+
+    @classmethod
+    def _compile_to_sql_values(cls):
+        """Generate `_fast_to_sql_values` for this class from its annotations.
+
+        One line per column with the conversion picked from the column type,
+        instead of running the isinstance checks per value per row.
+        """
+        try:
+            hints = get_type_hints(cls)
+        except Exception:  # pylint: disable=broad-except
+            hints = {}
+        lines = ["def _fast_to_sql_values(self):", "    return ("]
+        for key in cls._sql_order_tuple:
+            if key in hints:
+                attr_ = f"self.{key}"
+            else:
+                attr_ = f"getattr(self, {key!r}, None)"
+            converter = _SQL_CONVERTERS[_value_kind(hints.get(key))]
+            lines.append(f"        {converter}({attr_})," if converter else f"        {attr_},")
+        lines.append("    )")
+        namespace = {name: globals()[name] for name in _SQL_CONVERTERS.values() if name}
+        exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+        fast = namespace["_fast_to_sql_values"]
+        cls._fast_to_sql_values = staticmethod(fast)
+        return fast
+
+
+def _sql_json(value):
+    """Dictionaries and nested models as JSON strings."""
+    if value is None:
+        return None
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return orjson.dumps(value).decode()
+
+
+def _sql_str(value):
+    """URLs as strings."""
+    if value is None:
+        return None
+    return str(value)
+
+
+def _sql_any(value):
+    """Value of unknown column type, checked at runtime."""
+    if isinstance(value, (dict, BaseModel)):
+        return _sql_json(value)
+    if isinstance(value, AnyUrl):
+        return str(value)
+    return value
+
+
+# column kind -> converter used in the generated `_fast_to_sql_values`
+_SQL_CONVERTERS = {"plain": None, "json": "_sql_json", "str": "_sql_str",
+                   "any": "_sql_any"}
+
+
+def _is_subclass(type_, cls: type) -> bool:
+    """Whether `type_` is a class derived from `cls`."""
+    return isinstance(type_, type) and issubclass(type_, cls)
+
+
+def _strip_optional(type_):
+    """`X` from `Optional[X]`, None for other unions."""
+    if get_origin(type_) in (Union, UnionType):
+        args = [x for x in get_args(type_) if x is not type(None)]
+        return args[0] if len(args) == 1 else None
+    return type_
+
+
+def _value_kind(type_) -> str:
+    """Kind of conversion needed for a column annotated with `type_`."""
+    type_ = _strip_optional(type_)
+    if type_ is dict or get_origin(type_) is dict or _is_subclass(type_, BaseModel):
+        return "json"
+    if _is_subclass(type_, AnyUrl):
+        return "str"
+    # datetimes go through psycopg's own adapter
+    if type_ in (str, int, float, bool, datetime) or get_origin(type_) is list:
+        return "plain"
+    return "any"
+
+
+_PG_TYPES = {str: "text", int: "bigint", float: "double precision",
+             bool: "boolean", datetime: "timestamp", dict: "jsonb"}
+
+
+def _pg_type(type_) -> str:
+    """PostgreSQL type of a column annotated with `type_`, text if unknown."""
+    type_ = _strip_optional(type_)
+    if get_origin(type_) is list:
+        args = get_args(type_)
+        return _pg_type(args[0] if args else None) + "[]"
+    if get_origin(type_) is dict or _is_subclass(type_, BaseModel):
+        return "jsonb"
+    return _PG_TYPES.get(type_, "text")
+
+
+def unnest_params(rows: list[tuple], json_columns: tuple[int, ...] = ()) -> list[list]:
+    """Transpose `to_sql_values` rows into the column arrays of `sql_unnest`.
+
+    `json_columns` is the table's `_sql_unnest_json`, array columns that are
+    sent as jsonb.
+    """
+    columns = [list(col) for col in zip(*rows)]
+    for i in json_columns:
+        columns[i] = [None if v is None else orjson.dumps(v).decode()
+                      for v in columns[i]]
+    return columns
+
+
+def iter_sql_tables(table: SQLTable) -> Iterator[SQLTable]:
+    """Yield table and every populated row of its subtables."""
+    yield table
+    for subtable in table._sql_subtables_tuple:
+        attr_ = getattr(table, subtable)
+        if attr_ is None:
+            continue
+        if isinstance(attr_, list):
+            yield from attr_
+        else:
+            yield attr_
+
+
+def iter_sql_rows(table: SQLTable) -> Iterator[tuple[SQLTable, tuple]]:
+    """Yield (table, values) for table and every row of its subtables.
+
+    The first column of a subtable is always its parent key, it is filled
+    here from the parent `id`, so it does not need to be set on every row.
+    """
+    tables = iter_sql_tables(table)
+    parent = next(tables)
+    yield parent, parent.to_sql_values()
+    key = (getattr(parent, "id", None),)
+    for row in tables:
+        yield row, key + row.to_sql_values()[1:]
+
+
+@lru_cache(maxsize=None)
+def _subtables_query(key: str, tables: tuple[tuple[str, str, bool], ...]) -> str:
+    """Single SELECT returning every subtable of one parent as JSON columns."""
+    columns = []
+    for subtable, table_name, multivalue in tables:
+        if multivalue:
+            columns.append(
+                f"(SELECT json_agg(s) FROM {table_name} s WHERE s.{key} = %(id)s) AS {subtable}")
+        else:
+            columns.append(
+                f"(SELECT row_to_json(s) FROM {table_name} s WHERE s.{key} = %(id)s LIMIT 1) AS {subtable}")
+    return "SELECT " + ", ".join(columns)
+
+
+def fetch_subtables(conn: Connection, key: str, id_: str,
+                    classes: dict, multivalue: list[str]) -> dict:
+    """Fetch all subtables of one parent in a single round trip.
+
+    `classes` maps subtable names to their SQLTable classes, rows are
+    matched on the `key` column (e.g. `author_id`). Returns the subtables
+    with rows, lists for `multivalue` ones and a dict for the rest.
+    """
+    tables = tuple((subtable, _class_default(cls, "_sql_table_name"), subtable in multivalue)
+                   for subtable, cls in classes.items())
+    with conn.cursor(row_factory=dict_row) as cursor:
+        cursor.execute(_subtables_query(key, tables), {"id": id_})
+        row = cursor.fetchone()
+    return {k: v for k, v in row.items() if v is not None}  # type: ignore
+
+
+def _sql_column_value(value):
+    """Nested models as JSON-compatible dicts, other values unchanged."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value
+
+
+def _sql_columns_of(tables: list[SQLTable]) -> dict[str, list]:
+    """Columns of `tables` (all of the same class), as lists of native values."""
+    return {col: [_sql_column_value(getattr(x, col, None)) for x in tables]
+            for col in tables[0]._sql_order_tuple}
 
 
 def sql_tables_to_df(tables: list[SQLTable]) -> pd.DataFrame:
     """Convert SQL tables to DataFrame."""
-    list_ = [orjson.loads(x.model_dump_json(include=x._sql_order))  # type: ignore
-             for x in tables]
-    df = pd.DataFrame(list_)
-    return df
+    if len(tables) == 0:
+        return pd.DataFrame()
+    return pd.DataFrame(_sql_columns_of(tables))
+
+
+def sql_tables_to_arrow(tables: list[SQLTable]) -> pa.Table:
+    """Convert SQL tables to a pyarrow Table, one array per column."""
+    if len(tables) == 0:
+        return pa.table({})
+    return pa.table({col: pa.array(values)
+                     for col, values in _sql_columns_of(tables).items()})
 
 
 class BaseCountByYear(BaseModel):
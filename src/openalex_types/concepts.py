@@ -4,7 +4,13 @@
 
 from typing import Optional
 
-from openalex_types.common import BaseCountByYear, DateTimeNoTZ, OpenAlexObject, SQLTable
+from openalex_types.common import (
+    BaseCountByYear,
+    DateTimeNoTZ,
+    OpenAlexObject,
+    SQLTable,
+    fetch_subtables,
+)
 from openalex_types.utils import check
 from psycopg import Connection
 from pydantic import AliasChoices, BaseModel, Field, model_validator, field_validator
@@ -59,8 +65,10 @@ SQL_TABLES_TO_CLASSES = {
 }
 # which tables have multiple values (list)?
 MULTIVALUE = ["ancestors", "related_concepts", "counts_by_year"]
+# column order of each subtable, looked up once at import
+_SUBTABLE_ORDERS = {k: v._sql_order_tuple for k, v in SQL_TABLES_TO_CLASSES.items()}
 
-class Concept(OpenAlexObject, SQLTable):
+class Concept(OpenAlexObject, SQLTable, frozen=True):
     """OpenAlex Concepts."""
     wikidata: Optional[str] = None
     display_name: Optional[str] = None
@@ -110,40 +118,24 @@ class Concept(OpenAlexObject, SQLTable):
     def from_sql(t: tuple, conn: Optional[Connection] = None,
                  subtables: Optional[dict] = None) -> "Concept":
         """Create Concept from SQL."""
-        args = dict(zip(Concept._sql_order.default, t))  # type: ignore
+        args = dict(zip(Concept._sql_order_tuple, t))  # type: ignore
         if conn is None:
             if subtables is None:  # only Concept object
                 return Concept(**args)
             else:  # Concept object with subtables already queried
-                for subtable in Concept._sql_subtables.default:  # type: ignore
+                for subtable in Concept._sql_subtables_tuple:  # type: ignore
                     if subtable in subtables:
                         if subtable in MULTIVALUE:
                             args[subtable] = [dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, t)  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], t)
                             )
                                 for t in subtables[subtable]]
                         else:
                             args[subtable] = dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, subtables[subtable])  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], subtables[subtable])
                             )
             return Concept(**args)
         else:  # Query everything, connection is provided
-            id_ = t[0]
-            with conn.cursor() as cursor:
-                for subtable in Concept._sql_subtables.default:  # type: ignore
-                    subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
-                    if subtable in MULTIVALUE:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE concept_id = %s", (id_,))  # type: ignore
-                        list_ = [dict(zip(subtable_cls._sql_order.default, t))  # type: ignore
-                                 for t in cursor.fetchall()]
-                        if len(list_) > 0:
-                            args[subtable] = list_
-                    else:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE concept_id = %s", (id_,))  # type: ignore
-                        t = cursor.fetchone()
-                        if t is not None:
-                            args[subtable] = dict(
-                                zip(subtable_cls._sql_order.default, t))  # type: ignore
+            args.update(fetch_subtables(
+                conn, "concept_id", t[0], SQL_TABLES_TO_CLASSES, MULTIVALUE))
             return Concept(**args)    
@@ -2,15 +2,21 @@
 """Db for OpenAlex types."""
 # pylint: disable=W1203, E1101
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date as Date
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from queue import Empty, Full, Queue
+from threading import Event
+from typing import Any, Iterable, Iterator, Literal, Optional, Union
 
 import boto3
+import msgspec
 import orjson
 from botocore import UNSIGNED
 from botocore.config import Config
 from isal import igzip_threaded
+from openalex_types import ingest
 from openalex_types.authors import Author
 from openalex_types.common import OpenAlexObject
 from openalex_types.concepts import Concept
@@ -28,6 +34,11 @@ logger.setLevel(logging.INFO)
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Buffer for plain `gzip` reads, the stdlib default is too small for
+# multi-GB snapshot files (CPython raised its own to 128 KiB for the same
+# reason). `igzip_threaded` reads use their larger `block_size` instead.
+READ_BUFFER_SIZE = 128 * 1024
+
 TYPES = ["works", "authors", "topics", "concepts",
          "institutions", "publishers", "sources"]
 
@@ -41,42 +52,163 @@ PYDANTIC_MODELS = {
     "sources": Source,
 }
 
+# reused decoders into the msgspec ingest structs, built once
+_DECODERS = {
+    "works": msgspec.json.Decoder(ingest.Work),
+    "authors": msgspec.json.Decoder(ingest.Author),
+    "topics": msgspec.json.Decoder(ingest.Topic),
+    "concepts": msgspec.json.Decoder(ingest.Concept),
+    "institutions": msgspec.json.Decoder(ingest.Institution),
+    "publishers": msgspec.json.Decoder(ingest.Publisher),
+    "sources": msgspec.json.Decoder(ingest.Source),
+}
+
 
 @dataclass
 class SnapshotGZ:
     """Interface to interact with OpenAlex Snapshot file in GZ format."""
     path: Path
 
-    def read_lines(self, threads: int = 4, block_size: int = 1024 * 1024) -> list[bytes]:
-        """Read lines from GZ file."""
+    def iter_lines(self, threads: int = 4, block_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream lines from GZ file, without holding the whole file in memory."""
         logger.info(f"Reading lines from {self.path}")
         with igzip_threaded.open(self.path, "rb", threads=threads, block_size=block_size) as f:
-            lines = f.readlines()
-        return lines
+            yield from f
 
-    def as_dict_list(self, lines: Optional[list[bytes]] = None) -> list[dict]:
+    def read_lines(self, threads: int = 4, block_size: int = 1024 * 1024) -> list[bytes]:
+        """Read lines from GZ file."""
+        return list(self.iter_lines(threads=threads, block_size=block_size))
+
+    def as_dict_list(self, lines: Optional[Iterable[bytes]] = None) -> list[dict]:
         """Convert lines to list of dictionaries."""
         if lines is None:
-            lines = self.read_lines()
+            lines = self.iter_lines()
         return [orjson.loads(line) for line in lines]
 
-    def as_pydantic(self, type_: str, lines: Optional[list[bytes]] = None) -> list[OpenAlexObject]:
-        """Convert lines to list of Pydantic models."""
+    def iter_pydantic(self, type_: str,
+                      lines: Optional[Iterable[bytes]] = None) -> Iterator[OpenAlexObject]:
+        """Stream lines as Pydantic models."""
         if not type_ or type_ not in PYDANTIC_MODELS:
             raise ValueError(
                 f"Type not found: {type_}, must be one of {TYPES}")
         if lines is None:
-            lines = self.read_lines()
-        pydantic_objs = []
+            lines = self.iter_lines()
         model = PYDANTIC_MODELS[type_]
         for line in tqdm(lines):
             try:
-                pydantic_objs.append(
-                    model(**orjson.loads(line)))
+                yield model(**orjson.loads(line))
+            except Exception as e:
+                logger.error(f"Failed to parse line: {line}")
+                raise e
+
+    def as_pydantic(self, type_: str,
+                    lines: Optional[Iterable[bytes]] = None) -> list[OpenAlexObject]:
+        """Convert lines to list of Pydantic models."""
+        return list(self.iter_pydantic(type_, lines))
+
+    def iter_structs(self, type_: str,
+                     lines: Optional[Iterable[bytes]] = None) -> Iterator[ingest.IngestTable]:
+        """Stream lines as msgspec ingest structs, decoded without an intermediate dict."""
+        if not type_ or type_ not in _DECODERS:
+            raise ValueError(
+                f"Type not found: {type_}, must be one of {TYPES}")
+        if lines is None:
+            lines = self.iter_lines()
+        decode = _DECODERS[type_].decode
+        for line in tqdm(lines):
+            try:
+                yield decode(line)
             except Exception as e:
                 logger.error(f"Failed to parse line: {line}")
                 raise e
-        return pydantic_objs
+
+    def as_structs(self, type_: str,
+                   lines: Optional[Iterable[bytes]] = None) -> list[ingest.IngestTable]:
+        """Convert lines to list of msgspec ingest structs."""
+        return list(self.iter_structs(type_, lines))
+
+
+# end of a file's lines in its queue
+_END = object()
+
+
+def _put(queue: Queue, stop: Event, item) -> bool:
+    """Put item on a bounded queue, give up once `stop` is set."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _read_into_queue(file: SnapshotGZ, queue: Queue, stop: Event,
+                     threads: int, chunk_size: int) -> None:
+    """Put the lines of `file` on `queue` in chunks, then `_END` or the error."""
+    try:
+        chunk: list[bytes] = []
+        for line in file.iter_lines(threads=threads):
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                if not _put(queue, stop, chunk):
+                    return
+                chunk = []
+        if chunk and not _put(queue, stop, chunk):
+            return
+        _put(queue, stop, _END)
+    except Exception as e:  # pylint: disable=broad-except
+        _put(queue, stop, e)
+
+
+def _iter_queue(queue: Queue, stop: Event) -> Iterator[bytes]:
+    """Lines of one file from its queue, until `_END` or `stop`."""
+    while not stop.is_set():
+        try:
+            item = queue.get(timeout=0.1)
+        except Empty:
+            continue
+        if item is _END:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield from item
+
+
+def read_lines_parallel(files: list[SnapshotGZ], max_workers: int = 4,
+                        threads: int = 1, chunk_size: int = 10_000,
+                        max_chunks: int = 4) -> Iterator[Iterator[bytes]]:
+    """Read several GZ files concurrently, yield an iterator of lines per file, in order.
+
+    A single gzip member can not be split for inflating without an index,
+    so the parallelism is across snapshot files (ISA-L releases the GIL).
+    Each file streams through a queue of at most `max_chunks` chunks of
+    `chunk_size` lines, so about `max_workers * max_chunks * chunk_size`
+    lines are in memory at once. Taking the next iterator stops reading
+    the previous file.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+
+        def submit(file: SnapshotGZ):
+            queue: Queue = Queue(maxsize=max_chunks)
+            stop = Event()
+            executor.submit(_read_into_queue, file, queue, stop, threads, chunk_size)
+            pending.append((queue, stop))
+
+        try:
+            for file in files:
+                submit(file)
+                if len(pending) >= max_workers:
+                    yield _iter_queue(*pending[0])
+                    pending.popleft()[1].set()
+            while pending:
+                yield _iter_queue(*pending[0])
+                pending.popleft()[1].set()
+        finally:
+            # the workers exit on stop, so the executor can shut down
+            for _, stop in pending:
+                stop.set()
 
 
 # --- S3 ---
@@ -140,8 +272,9 @@ class S3Directory(BaseModel):
 @dataclass(config=ConfigDict(arbitrary_types_allowed=True))
 class SnapshotS3:
     """Interface to interact with OpenAlex snapshot on S3."""
+    # pool sized for the concurrent downloads of `download_dir`
     s3: boto3.session.Session = Field(default_factory=lambda: boto3.client(
-        's3', config=Config(signature_version=UNSIGNED)), frozen=True)
+        's3', config=Config(signature_version=UNSIGNED, max_pool_connections=32)), frozen=True)
     bucket_name: str = Field(default="openalex", frozen=True)
 
     def ls(self, prefix: Optional[str] = None,
@@ -181,10 +314,22 @@ class SnapshotS3:
             res[tp] = self.ls_dirs(tp, from_date=from_date, **kwargs)
         return res
 
+    def stream_object(self, key: str, threads: int = 4,
+                      block_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream lines of a GZ object, inflated in memory, nothing written to disk.
+
+        Lines can be passed to `SnapshotGZ.as_dict_list` / `iter_pydantic`.
+        """
+        logger.info(f"Streaming lines from {key}")
+        body = self.s3.get_object(Bucket=self.bucket_name, Key=key)["Body"]
+        with igzip_threaded.open(body, "rb", threads=threads, block_size=block_size) as f:
+            yield from f
+
     def download_dir(self, name: S3Directory, output_path: str | Path,
-                     return_list: bool = False) -> Any:
+                     return_list: bool = False, max_workers: int = 32) -> Any:
         """Download directory from S3 - Recursive.
 
+        Files are downloaded concurrently by `max_workers` threads.
         If `return_list=True`, return a list of `SnapshotGZ` to the downloaded files.
         """
         outdir = Path(output_path)
@@ -193,25 +338,31 @@ class SnapshotS3:
         logger.debug(f"Found: {files_}")
         out_ = outdir.joinpath(name.Prefix.split('/')[-2])
         out_.mkdir(parents=True, exist_ok=True)
-        if return_list:
-            path_list = []
+        paths = [out_/file.split('/')[-1] for file in files_]
         try:
-            for file in tqdm(files_):
-                path_ = out_/file.split('/')[-1]
-                self.s3.download_file(self.bucket_name, file, path_)
-                logger.debug(f"Downloaded {file} to {path_.absolute()}")
-                if return_list:
-                    path_list.append(SnapshotGZ(path_.absolute()))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self.s3.download_file, self.bucket_name,
+                                           file, path_): file
+                           for file, path_ in zip(files_, paths)}
+                try:
+                    for future in tqdm(as_completed(futures), total=len(futures)):
+                        future.result()
+                        logger.debug(f"Downloaded {futures[future]}")
+                except BaseException:
+                    # do not start the queued downloads, only wait for running ones
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
         except Exception as e:
             logger.error(f"Failed to download {name}: {e}")
             raise e
         logger.debug(f"Downloaded {name} to {outdir.absolute()}")
         if return_list:
-            return path_list
+            return [SnapshotGZ(path_.absolute()) for path_ in paths]
         return out_
 
     def download_all(self, type_: str, output_path: str | Path,
-                     from_date: str | Date | None = None, return_list: bool = False) -> Any:
+                     from_date: str | Date | None = None, return_list: bool = False,
+                     max_workers: int = 32) -> Any:
         """Download all files of a OpenAlex type from S3 - Recursively."""
         dirs = self.ls_dirs(type_, from_date=from_date)
         logger.info(
@@ -221,9 +372,9 @@ class SnapshotS3:
         for dir_ in tqdm(dirs):
             if return_list:
                 path_list.extend(self.download_dir(
-                    dir_, output_path, return_list=True))
+                    dir_, output_path, return_list=True, max_workers=max_workers))
             else:
-                self.download_dir(dir_, output_path)
+                self.download_dir(dir_, output_path, max_workers=max_workers)
         if return_list:
             return path_list
         return output_path
@@ -0,0 +1,612 @@
+"""msgspec mirrors of the SQL tables, for the ingest hot path.
+
+The Pydantic models remain the public API. These structs only carry the
+columns written to SQL (plus what is needed to derive them) and decode a
+snapshot line in one pass with `msgspec.json.Decoder(Work).decode(line)`.
+Unknown fields are skipped by the decoder. Subtable rows do not carry
+their parent key, build rows with `openalex_types.common.iter_sql_rows`.
+"""
+# pylint: disable=too-few-public-methods
+from datetime import datetime
+from typing import ClassVar, Optional
+
+import msgspec
+from openalex_types.common import SQLTable, no_tz
+from openalex_types.works import _construct_abstract_from_index
+
+
+def _date_8601(value: Optional[str]) -> Optional[datetime]:
+    """ISO string as `Date8601` validates it."""
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _date_no_tz(value: Optional[str]) -> Optional[datetime]:
+    """ISO string as `DateTimeNoTZ` validates it."""
+    return None if value is None else no_tz(datetime.fromisoformat(value))
+
+
+# SQL types of the date columns, annotated as the str msgspec decodes
+# (date-only values are not valid msgspec datetimes)
+_PUBLICATION_DATE_TYPES = {"publication_date": "timestamp"}
+_UPDATED_DATE_TYPES = {"updated_date": "timestamp"}
+
+
+class IngestTable(msgspec.Struct, SQLTable, gc=False):
+    """SQL table row decoded with msgspec.
+
+    Rows never form reference cycles, so they are left out of the GC.
+    """
+    _sql_table_name: ClassVar[str]
+    _sql_order: ClassVar[list[str]]
+    _sql_subtables: ClassVar[list[str]] = []
+    # column -> SQL type, where the annotation does not give it
+    _sql_types: ClassVar[dict[str, str]] = {}
+
+
+class Ref(msgspec.Struct, gc=False):
+    """Dehydrated object, only its ID is needed."""
+    id: Optional[str] = None
+
+
+class DomainOrField(msgspec.Struct, gc=False):
+    """Topic Domain / Field / Subfield."""
+    id: Optional[str] = None
+    display_name: Optional[str] = None
+
+
+class BaseCountByYear(IngestTable):
+    """Base Count by Year."""
+    year: int
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    oa_works_count: Optional[int] = None
+
+
+# --- Works ---
+class BaseWorkLocation(IngestTable):
+    """Work Location."""
+    work_id: Optional[str] = None
+    source_id: Optional[str] = None
+    landing_page_url: Optional[str] = None
+    pdf_url: Optional[str] = None
+    is_oa: Optional[bool] = None
+    version: Optional[str] = None
+    license: Optional[str] = None
+    source: Optional[Ref] = None
+    _sql_order = ["work_id", "source_id", "landing_page_url",
+                  "pdf_url", "is_oa", "version", "license"]
+
+    def __post_init__(self):
+        if self.source is not None:
+            self.source_id = self.source.id
+
+
+class WorkPrimaryLocation(BaseWorkLocation):
+    """Primary Location."""
+    _sql_table_name = "openalex.works_primary_locations"
+
+
+class WorkLocation(BaseWorkLocation):
+    """Work Location."""
+    _sql_table_name = "openalex.works_locations"
+
+
+class WorkBestOALocation(BaseWorkLocation):
+    """Work Best OA Location."""
+    _sql_table_name = "openalex.works_best_oa_locations"
+
+
+class WorkAuthorship(IngestTable):
+    """Work Authorship."""
+    work_id: Optional[str] = None
+    author_position: Optional[str] = None
+    author_id: Optional[str] = None
+    institution_id: Optional[str] = None
+    raw_affiliation_string: Optional[str] = None
+    author: Optional[Ref] = None
+    institutions: Optional[list[Ref]] = None
+    _sql_table_name = "openalex.works_authorships"
+    _sql_order = ["work_id", "author_position", "author_id", "institution_id",
+                  "raw_affiliation_string"]
+
+    def __post_init__(self):
+        if self.author is not None:
+            self.author_id = self.author.id
+
+
+class WorkBiblio(IngestTable):
+    """Work Bibliographic Information."""
+    work_id: Optional[str] = None
+    volume: Optional[str] = None
+    issue: Optional[str] = None
+    first_page: Optional[str] = None
+    last_page: Optional[str] = None
+    _sql_table_name = "openalex.works_biblio"
+    _sql_order = ["work_id", "volume", "issue", "first_page", "last_page"]
+
+
+class WorkTopic(IngestTable):
+    """Work Topic."""
+    work_id: Optional[str] = None
+    topic_id: Optional[str] = msgspec.field(default=None, name="id")
+    score: Optional[float] = None
+    _sql_table_name = "openalex.works_topics"
+    _sql_order = ["work_id", "topic_id", "score"]
+
+
+class WorkConcept(IngestTable):
+    """Work Concept."""
+    work_id: Optional[str] = None
+    concept_id: Optional[str] = msgspec.field(default=None, name="id")
+    score: Optional[float] = None
+    _sql_table_name = "openalex.works_concepts"
+    _sql_order = ["work_id", "concept_id", "score"]
+
+
+class WorkIDs(IngestTable):
+    """Work ID."""
+    work_id: Optional[str] = None
+    openalex: Optional[str] = None
+    doi: Optional[str] = None
+    mag: Optional[int] = None
+    pmid: Optional[str] = None
+    pmcid: Optional[str] = None
+    _sql_table_name = "openalex.works_ids"
+    _sql_order = ["work_id", "openalex", "doi", "mag", "pmid", "pmcid"]
+
+
+class WorkMesh(IngestTable):
+    """Work Mesh."""
+    work_id: Optional[str] = None
+    descriptor_ui: Optional[str] = None
+    descriptor_name: Optional[str] = None
+    qualifier_ui: Optional[str] = None
+    qualifier_name: Optional[str] = None
+    is_major_topic: Optional[bool] = None
+    _sql_table_name = "openalex.works_mesh"
+    _sql_order = ["work_id", "descriptor_ui", "descriptor_name",
+                  "qualifier_ui", "qualifier_name", "is_major_topic"]
+
+
+class WorkOpenAccess(IngestTable):
+    """Work Open Access."""
+    work_id: Optional[str] = None
+    is_oa: Optional[bool] = None
+    oa_status: Optional[str] = None
+    oa_url: Optional[str] = None
+    any_repository_has_fulltext: Optional[bool] = None
+    _sql_table_name = "openalex.works_open_access"
+    _sql_order = ["work_id", "is_oa", "oa_status", "oa_url",
+                  "any_repository_has_fulltext"]
+
+
+class WorkReferencedWork(IngestTable):
+    """Work Referenced Work."""
+    work_id: Optional[str] = None
+    referenced_work_id: Optional[str] = None
+    _sql_table_name = "openalex.works_referenced_works"
+    _sql_order = ["work_id", "referenced_work_id"]
+
+
+class WorkRelatedWork(IngestTable):
+    """Work Related Work."""
+    work_id: Optional[str] = None
+    related_work_id: Optional[str] = None
+    _sql_table_name = "openalex.works_related_works"
+    _sql_order = ["work_id", "related_work_id"]
+
+
+class Work(IngestTable):
+    """OpenAlex Works."""
+    id: str
+    doi: Optional[str] = None
+    title: Optional[str] = None
+    display_name: Optional[str] = None
+    publication_year: Optional[int] = None
+    publication_date: Optional[str] = None  # datetime after __post_init__
+    type: Optional[str] = None
+    cited_by_count: Optional[int] = None
+    is_retracted: Optional[bool] = None
+    is_paratext: Optional[bool] = None
+    cited_by_api_url: Optional[str] = None
+    abstract: Optional[str] = None
+    abstract_inverted_index: Optional[dict[str, list[int]]] = None
+    language: Optional[str] = None
+    ids: Optional[WorkIDs] = None
+    locations: Optional[list[WorkLocation]] = None
+    authorships: Optional[list[WorkAuthorship]] = None
+    biblio: Optional[WorkBiblio] = None
+    topics: Optional[list[WorkTopic]] = None
+    concepts: Optional[list[WorkConcept]] = None
+    mesh: Optional[list[WorkMesh]] = None
+    open_access: Optional[WorkOpenAccess] = None
+    referenced_works: Optional[list[str]] = None
+    related_works: Optional[list[str]] = None
+    best_oa_location: Optional[WorkBestOALocation] = None
+    primary_location: Optional[WorkPrimaryLocation] = None
+    _sql_table_name = "openalex.works"
+    _sql_types: ClassVar[dict[str, str]] = _PUBLICATION_DATE_TYPES
+    _sql_order = ["id", "doi", "title", "display_name", "publication_year",
+                  "publication_date", "type",
+                  "cited_by_count", "is_retracted", "is_paratext",
+                  "cited_by_api_url", "abstract",
+                  "language"
+                  ]
+    _sql_subtables = ["primary_location", "locations", "best_oa_location",
+                      "authorships", "biblio", "topics", "concepts", "ids",
+                      "mesh", "open_access", "referenced_works", "related_works"]
+
+    def __post_init__(self):
+        """Flatten authorships, work_id is emitted by `iter_sql_rows`."""
+        id_ = self.id
+        self.publication_date = _date_8601(self.publication_date)
+        if self.abstract is None and self.abstract_inverted_index:
+            self.abstract = _construct_abstract_from_index(self.abstract_inverted_index)
+        if self.authorships is not None:
+            # NOTE: one row per institution, as in the Pydantic model
+            authorships = []
+            for authorship in self.authorships:
+                if not authorship.institutions:
+                    authorships.append(authorship)
+                    continue
+                for institution in authorship.institutions:
+                    authorships.append(msgspec.structs.replace(
+                        authorship, institution_id=institution.id))
+            self.authorships = authorships
+        if self.referenced_works is not None:
+            self.referenced_works = [WorkReferencedWork(id_, x)
+                                     for x in self.referenced_works]
+        if self.related_works is not None:
+            self.related_works = [WorkRelatedWork(id_, x)
+                                  for x in self.related_works]
+
+
+# --- Authors ---
+class AuthorCountByYear(BaseCountByYear):
+    """Author Count by Year."""
+    author_id: Optional[str] = None
+    _sql_table_name = "openalex.authors_counts_by_year"
+    _sql_order = ["author_id", "year", "works_count",
+                  "cited_by_count", "oa_works_count"]
+
+
+class AuthorIDs(IngestTable):
+    """Author ID."""
+    author_id: Optional[str] = None
+    openalex: Optional[str] = None
+    orcid: Optional[str] = None
+    scopus: Optional[str] = None
+    twitter: Optional[str] = None
+    wikipedia: Optional[str] = None
+    mag: Optional[int] = None
+    _sql_table_name = "openalex.authors_ids"
+    _sql_order = ["author_id", "openalex", "orcid", "scopus",
+                  "twitter", "wikipedia", "mag"]
+
+
+class Author(IngestTable):
+    """OpenAlex Authors."""
+    id: str
+    orcid: Optional[str] = None
+    display_name: Optional[str] = None
+    display_name_alternatives: Optional[list[str]] = None
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    last_known_institution: Optional[str] = None
+    works_api_url: Optional[str] = None
+    updated_date: Optional[str] = None  # datetime after __post_init__
+    ids: Optional[AuthorIDs] = None
+    counts_by_year: Optional[list[AuthorCountByYear]] = None
+    _sql_table_name = "openalex.authors"
+    _sql_types: ClassVar[dict[str, str]] = _UPDATED_DATE_TYPES
+    _sql_order = ["id", "orcid", "display_name", "display_name_alternatives", "works_count", "cited_by_count",
+                  "last_known_institution", "works_api_url", "updated_date"]
+    _sql_subtables = ["counts_by_year", "ids"]
+
+    def __post_init__(self):
+        """Clean display names, author_id is emitted by `iter_sql_rows`."""
+        self.updated_date = _date_no_tz(self.updated_date)
+        if self.display_name_alternatives:
+            self.display_name_alternatives = [
+                x.replace('"', "") for x in self.display_name_alternatives]
+        else:
+            self.display_name_alternatives = None
+
+
+# --- Concepts ---
+class ConceptAncestor(IngestTable):
+    """OpenAlex Concept Ancestors."""
+    concept_id: Optional[str] = None
+    ancestor_id: Optional[str] = msgspec.field(default=None, name="id")
+    _sql_table_name = "openalex.concepts_ancestors"
+    _sql_order = ["concept_id", "ancestor_id"]
+
+
+class ConceptCountByYear(BaseCountByYear):
+    """Concept Count by Year."""
+    concept_id: Optional[str] = None
+    _sql_table_name = "openalex.concepts_counts_by_year"
+    _sql_order = ["concept_id", "year", "works_count",
+                  "cited_by_count", "oa_works_count"]
+
+
+class ConceptIDs(IngestTable):
+    """Concept ID."""
+    concept_id: Optional[str] = None
+    openalex: Optional[str] = None
+    wikidata: Optional[str] = None
+    wikipedia: Optional[str] = None
+    umls_aui: Optional[list[str]] = None
+    umls_cui: Optional[list[str]] = None
+    mag: Optional[int] = None
+    _sql_table_name = "openalex.concepts_ids"
+    _sql_order = ["concept_id", "openalex", "wikidata", "wikipedia",
+                  "umls_aui", "umls_cui", "mag"]
+
+
+class ConceptRelatedConcept(IngestTable):
+    """Related Concepts."""
+    concept_id: Optional[str] = None
+    related_concept_id: Optional[str] = msgspec.field(default=None, name="id")
+    score: Optional[float] = None
+    _sql_table_name = "openalex.concepts_related_concepts"
+    _sql_order = ["concept_id", "related_concept_id", "score"]
+
+
+class Concept(IngestTable):
+    """OpenAlex Concepts."""
+    id: str
+    wikidata: Optional[str] = None
+    display_name: Optional[str] = None
+    level: Optional[int] = None
+    description: Optional[str] = None
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    image_url: Optional[str] = None
+    image_thumbnail_url: Optional[str] = None
+    works_api_url: Optional[str] = None
+    updated_date: Optional[str] = None  # datetime after __post_init__
+    ancestors: Optional[list[ConceptAncestor]] = None
+    related_concepts: Optional[list[ConceptRelatedConcept]] = None
+    counts_by_year: Optional[list[ConceptCountByYear]] = None
+    ids: Optional[ConceptIDs] = None
+    _sql_table_name = "openalex.concepts"
+    _sql_types: ClassVar[dict[str, str]] = _UPDATED_DATE_TYPES
+    _sql_order = ["id", "wikidata", "display_name", "level", "description",
+                  "works_count", "cited_by_count", "image_url", "image_thumbnail_url",
+                  "works_api_url", "updated_date"]
+    _sql_subtables = ["ancestors", "related_concepts", "counts_by_year", "ids"]
+
+    def __post_init__(self):
+        """Parse dates, concept_id is emitted by `iter_sql_rows`."""
+        self.updated_date = _date_no_tz(self.updated_date)
+
+
+# --- Institutions ---
+class InstitutionAssociatedInstitution(IngestTable):
+    """Associated Institutions."""
+    institution_id: Optional[str] = None
+    associated_institution_id: Optional[str] = msgspec.field(
+        default=None, name="id")
+    relationship: Optional[str] = None
+    _sql_table_name = "openalex.institutions_associated_institutions"
+    _sql_order = ["institution_id", "associated_institution_id",
+                  "relationship"]
+
+
+class InstitutionCountByYear(BaseCountByYear):
+    """Institution Count by Year."""
+    institution_id: Optional[str] = None
+    _sql_table_name = "openalex.institutions_counts_by_year"
+    _sql_order = ["institution_id", "year", "works_count",
+                  "cited_by_count", "oa_works_count"]
+
+
+class InstitutionGeo(IngestTable):
+    """Institution Geo."""
+    institution_id: Optional[str] = None
+    city: Optional[str] = None
+    geonames_city_id: Optional[str] = None
+    region: Optional[str] = None
+    country_code: Optional[str] = None
+    country: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    _sql_table_name = "openalex.institutions_geo"
+    _sql_order = ["institution_id", "city", "geonames_city_id",
+                  "region", "country_code", "country", "latitude", "longitude"]
+
+
+class InstitutionIDs(IngestTable):
+    """Institution ID."""
+    institution_id: Optional[str] = None
+    openalex: Optional[str] = None
+    ror: Optional[str] = None
+    grid: Optional[str] = None
+    wikidata: Optional[str] = None
+    wikipedia: Optional[str] = None
+    mag: Optional[int] = None
+    _sql_table_name = "openalex.institutions_ids"
+    _sql_order = ["institution_id", "openalex", "ror",
+                  "grid", "wikipedia", "wikidata", "mag"]
+
+
+class Institution(IngestTable):
+    """OpenAlex Institutions."""
+    id: str
+    ror: Optional[str] = None
+    display_name: Optional[str] = None
+    country_code: Optional[str] = None
+    type: Optional[str] = None
+    homepage_url: Optional[str] = None
+    image_url: Optional[str] = None
+    image_thumbnail_url: Optional[str] = None
+    display_name_acronyms: Optional[list[str]] = None
+    display_name_alternatives: Optional[list[str]] = None
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    works_api_url: Optional[str] = None
+    updated_date: Optional[str] = None  # datetime after __post_init__
+    geo: Optional[InstitutionGeo] = None
+    counts_by_year: Optional[list[InstitutionCountByYear]] = None
+    ids: Optional[InstitutionIDs] = None
+    associated_institutions: Optional[list[InstitutionAssociatedInstitution]] = None
+    _sql_table_name = "openalex.institutions"
+    _sql_types: ClassVar[dict[str, str]] = _UPDATED_DATE_TYPES
+    _sql_order = ["id", "ror", "display_name", "country_code",
+                  "type", "homepage_url", "image_url", "image_thumbnail_url",
+                  "display_name_acronyms", "display_name_alternatives",
+                  "works_count", "cited_by_count", "works_api_url",
+                  "updated_date"]
+    _sql_subtables = ["associated_institutions",
+                      "counts_by_year", "geo", "ids"]
+
+    def __post_init__(self):
+        """Parse dates, institution_id is emitted by `iter_sql_rows`."""
+        self.updated_date = _date_no_tz(self.updated_date)
+        # NOTE: empty lists are stored as NULL, as in the Pydantic model
+        if not self.display_name_acronyms:
+            self.display_name_acronyms = None
+        if not self.display_name_alternatives:
+            self.display_name_alternatives = None
+
+
+# --- Publishers ---
+class PublisherCountByYear(BaseCountByYear):
+    """Publisher Count by Year."""
+    publisher_id: Optional[str] = None
+    _sql_table_name = "openalex.publishers_counts_by_year"
+    _sql_order = ["publisher_id", "year", "works_count",
+                  "cited_by_count", "oa_works_count"]
+
+
+class PublisherIDs(IngestTable):
+    """Publisher ID."""
+    publisher_id: Optional[str] = None
+    openalex: Optional[str] = None
+    ror: Optional[str] = None
+    wikidata: Optional[str] = None
+    _sql_table_name = "openalex.publishers_ids"
+    _sql_order = ["publisher_id", "openalex", "ror", "wikidata"]
+
+
+class Publisher(IngestTable):
+    """OpenAlex Publishers."""
+    id: str
+    display_name: Optional[str] = None
+    alternate_titles: Optional[list[str]] = None
+    country_codes: Optional[list[str]] = None
+    hierarchy_level: Optional[int] = None
+    parent_publisher: Optional[dict] = None
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    sources_api_url: Optional[str] = None
+    updated_date: Optional[str] = None  # datetime after __post_init__
+    counts_by_year: Optional[list[PublisherCountByYear]] = None
+    ids: Optional[PublisherIDs] = None
+    _sql_table_name = "openalex.publishers"
+    _sql_types: ClassVar[dict[str, str]] = _UPDATED_DATE_TYPES
+    _sql_order = ["id", "display_name", "alternate_titles",
+                  "country_codes", "hierarchy_level", "parent_publisher",
+                  "works_count", "cited_by_count", "sources_api_url",
+                  "updated_date"]
+    _sql_subtables = ["counts_by_year", "ids"]
+
+    def __post_init__(self):
+        """Parse dates, publisher_id is emitted by `iter_sql_rows`."""
+        self.updated_date = _date_no_tz(self.updated_date)
+
+
+# --- Sources ---
+class SourceCountByYear(BaseCountByYear):
+    """Source Count by Year."""
+    source_id: Optional[str] = None
+    _sql_table_name = "openalex.sources_counts_by_year"
+    _sql_order = ["source_id", "year", "works_count", "cited_by_count",
+                  "oa_works_count"]
+
+
+class SourceIDs(IngestTable):
+    """Source ID."""
+    source_id: Optional[str] = None
+    openalex: Optional[str] = None
+    issn_l: Optional[str] = None
+    issn: Optional[list[str]] = None
+    mag: Optional[int] = None
+    wikidata: Optional[str] = None
+    fatcat: Optional[str] = None
+    _sql_table_name = "openalex.sources_ids"
+    _sql_order = ["source_id", "openalex", "issn_l",
+                  "issn", "mag", "wikidata", "fatcat"]
+
+
+class Source(IngestTable):
+    """OpenAlex Sources."""
+    id: str
+    issn_l: Optional[str] = None
+    issn: Optional[list[str]] = None
+    display_name: Optional[str] = None
+    publisher: Optional[str] = None
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    is_oa: Optional[bool] = None
+    is_in_doaj: Optional[bool] = None
+    homepage_url: Optional[str] = None
+    works_api_url: Optional[str] = None
+    updated_date: Optional[str] = None  # datetime after __post_init__
+    counts_by_year: Optional[list[SourceCountByYear]] = None
+    ids: Optional[SourceIDs] = None
+    _sql_table_name = "openalex.sources"
+    _sql_types: ClassVar[dict[str, str]] = _UPDATED_DATE_TYPES
+    _sql_order = ["id", "issn_l", "issn", "display_name",
+                  "publisher", "works_count", "cited_by_count",
+                  "is_oa", "is_in_doaj", "homepage_url", "works_api_url",
+                  "updated_date"]
+    _sql_subtables = ["counts_by_year", "ids"]
+
+    def __post_init__(self):
+        """Parse dates, source_id is emitted by `iter_sql_rows`."""
+        self.updated_date = _date_no_tz(self.updated_date)
+
+
+# --- Topics ---
+class Topic(IngestTable):
+    """OpenAlex Topics."""
+    id: str
+    display_name: Optional[str] = None
+    subfield_id: Optional[str] = None
+    subfield_display_name: Optional[str] = None
+    field_id: Optional[str] = None
+    field_display_name: Optional[str] = None
+    domain_id: Optional[str] = None
+    domain_display_name: Optional[str] = None
+    description: Optional[str] = None
+    keywords: Optional[list[str]] = None
+    works_api_url: Optional[str] = None
+    wikipedia_id: Optional[str] = None
+    works_count: Optional[int] = None
+    cited_by_count: Optional[int] = None
+    updated_date: Optional[str] = None  # datetime after __post_init__
+    domain: Optional[DomainOrField] = None
+    field: Optional[DomainOrField] = None
+    subfield: Optional[DomainOrField] = None
+    _sql_table_name = "openalex.topics"
+    _sql_types: ClassVar[dict[str, str]] = _UPDATED_DATE_TYPES
+    _sql_order = ["id", "display_name", "subfield_id", "subfield_display_name",
+                  "field_id", "field_display_name", "domain_id",
+                  "domain_display_name", "description", "keywords",
+                  "works_api_url", "wikipedia_id", "works_count",
+                  "cited_by_count", "updated_date"]
+
+    def __post_init__(self):
+        """Flatten domain, field and subfield."""
+        self.updated_date = _date_no_tz(self.updated_date)
+        if self.domain is not None:
+            self.domain_id = self.domain.id
+            self.domain_display_name = self.domain.display_name
+        if self.field is not None:
+            self.field_id = self.field.id
+            self.field_display_name = self.field.display_name
+        if self.subfield is not None:
+            self.subfield_id = self.subfield.id
+            self.subfield_display_name = self.subfield.display_name
@@ -8,6 +8,7 @@ from openalex_types.common import (
     CountryCode,
     Date8601,
     DateTimeNoTZ,
+    fetch_subtables,
     OpenAlexObject,
     Role,
     SummaryStats,
@@ -93,8 +94,10 @@ SQL_TABLES_TO_CLASSES = {
 }
 # which tables have multiple values (list)?
 MULTIVALUE = ["associated_institutions", "counts_by_year"]
+# column order of each subtable, looked up once at import
+_SUBTABLE_ORDERS = {k: v._sql_order_tuple for k, v in SQL_TABLES_TO_CLASSES.items()}
 
-class Institution(OpenAlexObject, SQLTable):
+class Institution(OpenAlexObject, SQLTable, frozen=True):
     """OpenAlex Institutions."""
     ror: Optional[str] = None
     lineage: Optional[list[str]] = None
@@ -172,41 +175,25 @@ class Institution(OpenAlexObject, SQLTable):
     def from_sql(t: tuple, conn: Optional[Connection] = None,
                  subtables: Optional[dict] = None) -> "Institution":
         """Create Institution from SQL."""
-        args = dict(zip(Institution._sql_order.default, t))  # type: ignore
+        args = dict(zip(Institution._sql_order_tuple, t))  # type: ignore
         if conn is None:
             if subtables is None:  # only Institution object
                 return Institution(**args)
             else:  # Institution object with subtables already queried
-                for subtable in Institution._sql_subtables.default:  # type: ignore
+                for subtable in Institution._sql_subtables_tuple:  # type: ignore
                     if subtable in subtables:
                         if subtable in MULTIVALUE:
                             args[subtable] = [dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, t)  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], t)
                             )
                                 for t in subtables[subtable]]
                         else:
                             args[subtable] = dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, subtables[subtable])  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], subtables[subtable])
                             )
 
             return Institution(**args)
         else:  # Query everything, connection is provided
-            id_ = t[0]
-            with conn.cursor() as cursor:
-                for subtable in Institution._sql_subtables.default:  # type: ignore
-                    subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
-                    if subtable in MULTIVALUE:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE institution_id = %s", (id_,))  # type: ignore
-                        list_ = [dict(zip(subtable_cls._sql_order.default, t))  # type: ignore
-                                 for t in cursor.fetchall()]
-                        if len(list_) > 0:
-                            args[subtable] = list_
-                    else:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE institution_id = %s", (id_,))  # type: ignore
-                        t = cursor.fetchone()
-                        if t is not None:
-                            args[subtable] = dict(
-                                zip(subtable_cls._sql_order.default, t))  # type: ignore
+            args.update(fetch_subtables(
+                conn, "institution_id", t[0], SQL_TABLES_TO_CLASSES, MULTIVALUE))
             return Institution(**args)
@@ -8,6 +8,7 @@ from openalex_types.common import (
     CountryCode,
     Date8601,
     DateTimeNoTZ,
+    fetch_subtables,
     OpenAlexObject,
     Role,
     SummaryStats,
@@ -47,8 +48,10 @@ SQL_TABLES_TO_CLASSES = {
 }
 # which tables have multiple values (list)?
 MULTIVALUE = ["counts_by_year"]
+# column order of each subtable, looked up once at import
+_SUBTABLE_ORDERS = {k: v._sql_order_tuple for k, v in SQL_TABLES_TO_CLASSES.items()}
 
-class Publisher(OpenAlexObject, SQLTable):
+class Publisher(OpenAlexObject, SQLTable, frozen=True):
     """OpenAlex Publishers."""
     display_name: Optional[str] = None
     alternate_titles: Optional[list[str]] = None  # NOTE: SQL json?
@@ -92,41 +95,25 @@ class Publisher(OpenAlexObject, SQLTable):
     def from_sql(t: tuple, conn: Optional[Connection] = None,
                  subtables: Optional[dict] = None) -> "Publisher":
         """Create Publisher from SQL."""
-        args = dict(zip(Publisher._sql_order.default, t))
+        args = dict(zip(Publisher._sql_order_tuple, t))
         if conn is None:
             if subtables is None:  # only Publisher object
                 return Publisher(**args)
             else:  # Publisher object with subtables already queried
-                for subtable in Publisher._sql_subtables.default:  
+                for subtable in Publisher._sql_subtables_tuple:  
                     if subtable in subtables:
                         if subtable in MULTIVALUE:
                             args[subtable] = [dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, t)
+                                _SUBTABLE_ORDERS[subtable], t)
                             )
                                 for t in subtables[subtable]]
                         else:
                             args[subtable] = dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, subtables[subtable])
+                                _SUBTABLE_ORDERS[subtable], subtables[subtable])
                             )
 
             return Publisher(**args)
         else:  # Query everything, connection is provided
-            id_ = t[0]
-            with conn.cursor() as cursor:
-                for subtable in Publisher._sql_subtables.default:
-                    subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
-                    if subtable in MULTIVALUE:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE publisher_id = %s", (id_,))
-                        list_ = [dict(zip(subtable_cls._sql_order.default, t))
-                                 for t in cursor.fetchall()]
-                        if len(list_) > 0:
-                            args[subtable] = list_
-                    else:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE publisher_id = %s", (id_,))
-                        t = cursor.fetchone()
-                        if t is not None:
-                            args[subtable] = dict(
-                                zip(subtable_cls._sql_order.default, t))
+            args.update(fetch_subtables(
+                conn, "publisher_id", t[0], SQL_TABLES_TO_CLASSES, MULTIVALUE))
             return Publisher(**args)
\ No newline at end of file
@@ -7,6 +7,7 @@ from openalex_types.common import (
     BaseCountByYear,
     CountryCode,
     DateTimeNoTZ,
+    fetch_subtables,
     OpenAlexObject,
     SummaryStats,
     SQLTable,
@@ -63,8 +64,10 @@ SQL_TABLES_TO_CLASSES = {
 }
 # which tables have multiple values (list)?
 MULTIVALUE = ["counts_by_year"]
+# column order of each subtable, looked up once at import
+_SUBTABLE_ORDERS = {k: v._sql_order_tuple for k, v in SQL_TABLES_TO_CLASSES.items()}
 
-class Source(OpenAlexObject, SQLTable):
+class Source(OpenAlexObject, SQLTable, frozen=True):
     """OpenAlex Sources."""
     issn_l: Optional[str] = None
     # issn: Optional[dict] = None
@@ -112,41 +115,25 @@ class Source(OpenAlexObject, SQLTable):
     def from_sql(t: tuple, conn: Optional[Connection] = None,
                  subtables: Optional[dict] = None) -> "Source":
         """Create Source from SQL."""
-        args = dict(zip(Source._sql_order.default, t))
+        args = dict(zip(Source._sql_order_tuple, t))
         if conn is None:
             if subtables is None:  # only Source object
                 return Source(**args)
             else:  # Source object with subtables already queried
-                for subtable in Source._sql_subtables.default:  
+                for subtable in Source._sql_subtables_tuple:  
                     if subtable in subtables:
                         if subtable in MULTIVALUE:
                             args[subtable] = [dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, t)
+                                _SUBTABLE_ORDERS[subtable], t)
                             )
                                 for t in subtables[subtable]]
                         else:
                             args[subtable] = dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, subtables[subtable])
+                                _SUBTABLE_ORDERS[subtable], subtables[subtable])
                             )
 
             return Source(**args)
         else:  # Query everything, connection is provided
-            id_ = t[0]
-            with conn.cursor() as cursor:
-                for subtable in Source._sql_subtables.default:
-                    subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
-                    if subtable in MULTIVALUE:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE source_id = %s", (id_,))
-                        list_ = [dict(zip(subtable_cls._sql_order.default, t))
-                                 for t in cursor.fetchall()]
-                        if len(list_) > 0:
-                            args[subtable] = list_
-                    else:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE source_id = %s", (id_,))
-                        t = cursor.fetchone()
-                        if t is not None:
-                            args[subtable] = dict(
-                                zip(subtable_cls._sql_order.default, t))
+            args.update(fetch_subtables(
+                conn, "source_id", t[0], SQL_TABLES_TO_CLASSES, MULTIVALUE))
             return Source(**args)
\ No newline at end of file
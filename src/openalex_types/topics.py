@@ -92,5 +92,5 @@ class Topic(OpenAlexObject, SQLTable):
     @staticmethod
     def from_sql(t: tuple) -> "Topic":
         """Create Topic from SQL."""
-        args = dict(zip(Topic._sql_order.default, t))
+        args = dict(zip(Topic._sql_order_tuple, t))
         return Topic(**args)
\ No newline at end of file
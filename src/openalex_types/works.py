@@ -3,22 +3,35 @@
 
 import logging
 import os
+from collections import defaultdict
 from typing import Literal, Optional
 
+import numpy as np
 from dotenv import find_dotenv, load_dotenv
 from openalex_types.authors import DehydratedAuthor
-from openalex_types.common import Date8601, OpenAlexObject, SQLTable
+from openalex_types.common import (
+    Date8601,
+    OpenAlexObject,
+    SQLTable,
+    _class_default,
+    iter_sql_rows,
+)
 from openalex_types.institutions import DehydratedInstitution
 from openalex_types.sources import Source
-from openalex_types.utils import check
-from psycopg import Connection
+from psycopg import Connection, sql
 from pydantic import (
     AliasChoices,
     BaseModel,
+    ConfigDict,
     Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_serializer,
+    WithJsonSchema,
     field_validator,
     model_validator,
 )
+from typing_extensions import Annotated
 
 load_dotenv(find_dotenv(), override=True)
 
@@ -33,12 +46,45 @@ logger.info(
     """)
 
 
-def _construct_dict_from_id(work_id: str, other_id: str) -> dict:
-    """Construct dict from ID."""
-    return {"id": other_id, "work_id": work_id}
+# positions per token above which the index is treated as sparse
+_SPARSE_ABSTRACT_RATIO = 16
+
+
+def _construct_abstract_from_index(index: Optional[dict[str, list[int]]]) -> str:
+    """Construct abstract from inverted index.
+
+    Dense indexes fill a list sized by the last position. Sparse ones
+    (truncated by OpenAlex, `max_` far above the token count) sort the
+    `(position, word)` pairs instead, O(k) memory rather than O(max_).
+    """
+    if not index:
+        return ""
+    # single pass over the positions, no intermediate list
+    max_ = max((p for positions in index.values() for p in positions), default=-1)
+    if max_ < 0:
+        return ""
+    if max_ > sum(map(len, index.values())) * _SPARSE_ABSTRACT_RATIO:
+        # last word wins a repeated position, as in the dense fill
+        words = {p: word for word, positions in index.items() for p in positions}
+        return " ".join(words[p] for p in sorted(words))
+    abs_ = [""] * (max_ + 1)
+    for word, positions in index.items():
+        for p in positions:
+            abs_[p] = word
+    return " ".join(abs_)
+
+
+def _ref_dict(work_id: str, referenced_work_id: str) -> dict:
+    """Referenced work row as dict."""
+    return {"referenced_work_id": referenced_work_id, "work_id": work_id}
+
+
+def _rel_dict(work_id: str, related_work_id: str) -> dict:
+    """Related work row as dict."""
+    return {"related_work_id": related_work_id, "work_id": work_id}
 
 
-class BaseWorkLocation(BaseModel):
+class BaseWorkLocation(BaseModel, frozen=True):
     """Work Location."""
     work_id: Optional[str] = None
     source_id: Optional[str] = None
@@ -58,12 +104,13 @@ class BaseWorkLocation(BaseModel):
     _sql_order = ["work_id", "source_id", "landing_page_url",
                   "pdf_url", "is_oa", "version", "license"]
 
-    @model_validator(mode="after")
-    def _populate_source_id(self):
-        """Populate source_id."""
-        if self.source is not None:
-            self.source_id = self.source.id
-        return self
+    @model_validator(mode="before")
+    @classmethod
+    def _populate_source_id(cls, data):
+        """Populate source_id from source, in place, before validation."""
+        if isinstance(data, dict) and (source := data.get("source")) is not None:
+            data["source_id"] = source.get("id") if isinstance(source, dict) else source.id
+        return data
 
 
 class WorkPrimaryLocation(BaseWorkLocation, SQLTable):
@@ -81,7 +128,7 @@ class WorkBestOALocation(BaseWorkLocation, SQLTable):
     _sql_table_name = "openalex.works_best_oa_locations"
 
 
-class WorkAuthorship(BaseModel, SQLTable):
+class WorkAuthorship(BaseModel, SQLTable, frozen=True):
     """Work Authorship."""
     work_id: Optional[str] = None
     author_position: Optional[Literal["first", "last", "middle"]] = None
@@ -102,8 +149,8 @@ class WorkAuthorship(BaseModel, SQLTable):
     @model_validator(mode="before")
     def _replicate_id(self):
         """Replicate author_id."""
-        if check("author", self):
-            self["author_id"] = self["author"]["id"]
+        if (author := self.get("author")) is not None:
+            self["author_id"] = author["id"]
         return self
 
     @model_validator(mode="after")
@@ -115,7 +162,7 @@ class WorkAuthorship(BaseModel, SQLTable):
         return self
 
 
-class WorkBiblio(BaseModel, SQLTable):
+class WorkBiblio(BaseModel, SQLTable, frozen=True):
     """Work Bibliographic Information."""
     work_id: Optional[str] = None
     volume: Optional[str] = None
@@ -126,7 +173,7 @@ class WorkBiblio(BaseModel, SQLTable):
     _sql_order = ["work_id", "volume", "issue", "first_page", "last_page"]
 
 
-class WorkTopic(BaseModel, SQLTable):
+class WorkTopic(BaseModel, SQLTable, frozen=True):
     """Work Topic."""
     # work_id: Optional[str] = Field(
     # None, validation_alias=AliasChoices("id", "work_id"))
@@ -139,7 +186,7 @@ class WorkTopic(BaseModel, SQLTable):
     _sql_order = ["work_id", "topic_id", "score"]
 
 
-class WorkConcept(BaseModel, SQLTable):
+class WorkConcept(BaseModel, SQLTable, frozen=True):
     """Work Concept."""
     work_id: Optional[str] = None
     concept_id: Optional[str] = Field(None,
@@ -149,7 +196,7 @@ class WorkConcept(BaseModel, SQLTable):
     _sql_order = ["work_id", "concept_id", "score"]
 
 
-class WorkIDs(BaseModel, SQLTable):
+class WorkIDs(BaseModel, SQLTable, frozen=True):
     """Work ID."""
     work_id: str
     openalex: Optional[str] = None
@@ -161,7 +208,7 @@ class WorkIDs(BaseModel, SQLTable):
     _sql_order = ["work_id", "openalex", "doi", "mag", "pmid", "pmcid"]
 
 
-class WorkMesh(BaseModel, SQLTable):
+class WorkMesh(BaseModel, SQLTable, frozen=True):
     """Work Mesh."""
     work_id: Optional[str] = None
     descriptor_ui: Optional[str] = None
@@ -174,16 +221,61 @@ class WorkMesh(BaseModel, SQLTable):
                   "qualifier_ui", "qualifier_name", "is_major_topic"]
 
 
+# dimension of the Nomic Embed Text vectors
+NOMIC_EMBED_DIM = 768
+
+
 class NomicEmbedText768(BaseModel, SQLTable):
-    """Embedding Nomic Embed Text Size 768."""
+    """Embedding Nomic Embed Text Size 768.
+
+    `to_sql_values` passes the embedding as a float32 ndarray, register the
+    pgvector adapter on the connection (`pgvector.psycopg.register_vector`)
+    before inserting it.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
     work_id: Optional[str] = None
     # model_name: Optional[str] = None
-    embedding: Optional[list[float]] = None
+    # NOTE: float32 array, not list[float], pgvector adapts it to vector(768)
+    embedding: Optional[Annotated[np.ndarray, WithJsonSchema(
+        {"type": "array", "items": {"type": "number"},
+         "minItems": NOMIC_EMBED_DIM, "maxItems": NOMIC_EMBED_DIM})]] = None
     _sql_table_name = "openalex.nomic_embed_text_768"
     _sql_order = ["work_id", "embedding"]
+    _sql_types = {"embedding": "vector"}
+
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def _to_float32(cls, value):
+        """Accept list[float], float32 bytes or ndarray, store a float32 ndarray."""
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = np.frombuffer(value, dtype=np.float32)
+        value = np.asarray(value, dtype=np.float32)
+        if value.shape != (NOMIC_EMBED_DIM,):
+            raise ValueError(
+                f"embedding must have shape ({NOMIC_EMBED_DIM},), got {value.shape}")
+        return value
+
+    @field_serializer("embedding")
+    def _serialize_embedding(self, value):
+        """Serialize embedding as a list of floats."""
+        if value is None:
+            return None
+        return value.tolist()
+
+    def __eq__(self, other):
+        """Compare embeddings by value, ndarray `==` is elementwise."""
+        if not isinstance(other, NomicEmbedText768):
+            return NotImplemented
+        if self.work_id != other.work_id:
+            return False
+        if self.embedding is None or other.embedding is None:
+            return self.embedding is other.embedding
+        return np.array_equal(self.embedding, other.embedding)
 
 
-class WorkOpenAccess(BaseModel, SQLTable):
+class WorkOpenAccess(BaseModel, SQLTable, frozen=True):
     """Work Open Access."""
     work_id: Optional[str] = None
     is_oa: Optional[bool] = None
@@ -195,25 +287,23 @@ class WorkOpenAccess(BaseModel, SQLTable):
                   "any_repository_has_fulltext"]
 
 
-class WorkReferencedWork(BaseModel, SQLTable):
+class WorkReferencedWork(BaseModel, SQLTable, frozen=True):
     """Work Referenced Work."""
     work_id: Optional[str] = None
-    referenced_work_id: Optional[str] = Field(
-        None, validation_alias=AliasChoices("id", "referenced_work_id"))
+    referenced_work_id: Optional[str] = None
     _sql_table_name = "openalex.works_referenced_works"
     _sql_order = ["work_id", "referenced_work_id"]
 
 
-class WorkRelatedWork(BaseModel, SQLTable):
+class WorkRelatedWork(BaseModel, SQLTable, frozen=True):
     """Work Related Work."""
     work_id: Optional[str] = None
-    related_work_id: Optional[str] = Field(
-        None, validation_alias=AliasChoices("id", "related_work_id"))
+    related_work_id: Optional[str] = None
     _sql_table_name = "openalex.works_related_works"
     _sql_order = ["work_id", "related_work_id"]
 
 
-class WorkAPC(BaseModel):
+class WorkAPC(BaseModel, frozen=True):
     """Work APC (article processing charge)."""
     value: Optional[int] = None
     currency: Optional[str] = None
@@ -221,20 +311,20 @@ class WorkAPC(BaseModel):
     value_usd: Optional[int] = None
 
 
-class WorkCountByYear(BaseModel):
+class WorkCountByYear(BaseModel, frozen=True):
     """Work Count by Year."""
     year: int
     cited_by_count: int
 
 
-class WorkGrant(BaseModel):
+class WorkGrant(BaseModel, frozen=True):
     """Grant for Work Object."""
     funder: Optional[str] = None
     funder_display_name: Optional[str] = None
     award_id: Optional[str] = None
 
 
-class WorkKeyword(BaseModel):
+class WorkKeyword(BaseModel, frozen=True):
     """Work Keyword."""
     id: Optional[str] = None
     display_name: Optional[str] = None
@@ -242,7 +332,7 @@ class WorkKeyword(BaseModel):
     # TODO: optional?
 
 
-class WorkSDG(BaseModel):
+class WorkSDG(BaseModel, frozen=True):
     """Work Sustainable Development Goals."""
     id: Optional[str] = None
     display_name: Optional[str] = None
@@ -268,7 +358,49 @@ MULTIVALUE = ["locations", "authorships", "topics", "concepts", "mesh",
               "referenced_works", "related_works"]
 
 
-class Work(OpenAlexObject, SQLTable, validate_assignment=True):
+# looked up once at import, not per row in from_sql
+_SUBTABLE_ORDERS = {k: v._sql_order_tuple for k, v in SQL_TABLES_TO_CLASSES.items()}
+_SUBTABLE_TABLES = {k: v._sql_table_name.default  # type: ignore
+                    for k, v in SQL_TABLES_TO_CLASSES.items()}
+
+
+def _subtable_query(subtable: str) -> sql.Composed:
+    """SELECT of a subtable's columns (all but work_id) for one work_id."""
+    return sql.SQL("SELECT {} FROM {} WHERE work_id = %s").format(
+        sql.SQL(", ").join(map(sql.Identifier, _SUBTABLE_ORDERS[subtable][1:])),
+        sql.Identifier(*_SUBTABLE_TABLES[subtable].split(".")))
+
+
+# validators of the subtables, resolved once rather than per from_sql row
+_SUBTABLE_ADAPTERS: dict[str, TypeAdapter] = {
+    k: TypeAdapter(list[v] if k in MULTIVALUE else v)  # type: ignore
+    for k, v in SQL_TABLES_TO_CLASSES.items()}
+# validation context of Works whose subtables `from_sql` already validated
+_FROM_SQL_CONTEXT = {"from_sql": True}
+
+
+def _sql_subtable_rows(subtable: str, value, work_id: str):
+    """Subtable value read from SQL as row dict(s) with work_id."""
+    if subtable == "referenced_works":
+        return [_ref_dict(work_id, x) for x in value]
+    if subtable == "related_works":
+        return [_rel_dict(work_id, x) for x in value]
+    if subtable in MULTIVALUE:
+        return [{**row, "work_id": work_id} for row in value]
+    return {**value, "work_id": work_id}
+
+
+# built once per process, executed as prepared statements by from_sql
+_SUBTABLE_QUERIES = {subtable: _subtable_query(subtable)
+                     for subtable in SQL_TABLES_TO_CLASSES}
+# and their batch versions, for from_sql_batch
+_SUBTABLE_BATCH_QUERIES = {
+    subtable: f"SELECT {', '.join(_SUBTABLE_ORDERS[subtable])} "
+              f"FROM {_SUBTABLE_TABLES[subtable]} WHERE work_id = ANY(%s)"
+    for subtable in SQL_TABLES_TO_CLASSES}
+
+
+class Work(OpenAlexObject, SQLTable, frozen=True):
     """OpenAlex Works."""
     doi: Optional[str] = None
     title: Optional[str] = None
@@ -330,98 +462,65 @@ class Work(OpenAlexObject, SQLTable, validate_assignment=True):
 
 
     @model_validator(mode="before")
-    def _replicate_id_1(self):
-        """Replicate work_id in 'subtables'."""
-        if check("counts_by_year", self):
-            for count_by_year in self["counts_by_year"]:
-                count_by_year["author_id"] = self["id"]
-        # replicate in ids
-        if check("ids", self):
-            self["ids"]["work_id"] = self["id"]
-        if check("locations", self):
-            for location in self["locations"]:
-                location["work_id"] = self["id"]
-        if check("authorships", self):
-            for authorship in self["authorships"]:
-                authorship["work_id"] = self["id"]
-        if check("biblio", self):
-            self["biblio"]["work_id"] = self["id"]
-        return self
-
-    @model_validator(mode="before")
-    def _replicate_id_2(self):
-        """Replicate IDs in 'subtables'."""
-        if check("topics", self):
-            for topic in self["topics"]:
-                topic["work_id"] = self["id"]
-        if check("concepts", self):
-            for concept in self["concepts"]:
-                concept["work_id"] = self["id"]
-        if check("mesh", self):
-            for mesh in self["mesh"]:
-                mesh["work_id"] = self["id"]
-        if check("open_access", self):
-            self["open_access"]["work_id"] = self["id"]
-        return self
-
-    @model_validator(mode="before")
-    def _replicate_id_3(self):
-        """Replicate IDs in 'subtables'."""
-        if check("best_oa_location", self):
-            self["best_oa_location"]["work_id"] = self["id"]
-        if check("primary_location", self):
-            self["primary_location"]["work_id"] = self["id"]
-        if check("locations", self):
-            for location in self["locations"]:
-                location["work_id"] = self["id"]
-        return self
-
-    @model_validator(mode="before")
-    def _work_id_ref_related(self):
-        """Appropriately format reference and related works as dict."""
-        if check("related_works", self):
-            if isinstance(self["related_works"], list):
-                if len(self["related_works"]) > 0:
-                    if isinstance(self["related_works"][0], str):
-                        for n, related_work in enumerate(self["related_works"]):
-                            self["related_works"][n] = _construct_dict_from_id(
-                                self["id"], related_work)
-                    elif not isinstance(self["related_works"][0], dict):
-                        raise ValueError(
-                            "related_works must be a list or dict.")
-        if check("referenced_works", self):
-            if isinstance(self["referenced_works"], list):
-                if len(self["referenced_works"]) > 0:
-                    if isinstance(self["referenced_works"][0], str):
-                        for n, referenced_work in enumerate(self["referenced_works"]):
-                            self["referenced_works"][n] = _construct_dict_from_id(
-                                self["id"], referenced_work)
-                    elif not isinstance(self["referenced_works"][0], dict):
-                        raise ValueError(
-                            "referenced_works must be a list or dict.")
-        return self
-
-    @model_validator(mode="before")
-    def _flatten_authorships(self):
-        """Flatten authorships, they can have multiple institutions."""
+    @classmethod
+    def _preprocess(cls, data, info: ValidationInfo):
+        """Build abstract, replicate work_id in 'subtables', format
+        referenced and related works and flatten authorships, in one pass.
+
+        Skipped for Works read by `from_sql`, their rows are already stored
+        in this shape and the subtables validated.
+        """
+        if info.context is _FROM_SQL_CONTEXT or not isinstance(data, dict):
+            return data
+        # a missing id is left to field validation to report
+        id_ = data.get("id")
+        # abstract, built once from abstract_inverted_index
+        if (index := data.get("abstract_inverted_index")) is not None \
+                and data.get("abstract") is None:
+            data["abstract"] = _construct_abstract_from_index(index)
+        # replicate work_id in 'subtables'
+        if (counts_by_year := data.get("counts_by_year")) is not None:
+            for count_by_year in counts_by_year:
+                count_by_year["author_id"] = id_
+        for one in ("ids", "biblio", "open_access"):
+            if (row := data.get(one)) is not None:
+                row["work_id"] = id_
+        for many in ("topics", "concepts", "mesh"):
+            if (rows := data.get(many)) is not None:
+                for row in rows:
+                    row["work_id"] = id_
+        for one in ("best_oa_location", "primary_location"):
+            if (location := data.get(one)) is not None:
+                location["work_id"] = id_
+        if (locations := data.get("locations")) is not None:
+            for location in locations:
+                location["work_id"] = id_
+        # reference and related works as dict
+        for key, to_dict in (("related_works", _rel_dict),
+                             ("referenced_works", _ref_dict)):
+            if isinstance(works := data.get(key), list) and len(works) > 0:
+                if isinstance(works[0], str):
+                    data[key] = [to_dict(id_, other_id) for other_id in works]
+                elif not isinstance(works[0], dict):
+                    raise ValueError(f"{key} must be a list or dict.")
+        # flatten authorships, they can have multiple institutions
         # NOTE: this will create multiple
         # authorships for author X that has multiple institutions
-        if check("authorships", self):
+        if (authorships_ := data.get("authorships")) is not None:
             authorships = []
-            for authorship in self["authorships"]:
-                if not check("institutions", authorship):
-                    authorships.append(authorship)
-                    continue
-                if authorship["institutions"] is None or len(authorship["institutions"]) == 0:
+            for authorship in authorships_:
+                authorship["work_id"] = id_
+                if not (institutions := authorship.get("institutions")):
                     authorships.append(authorship)
                     continue
-                for institution in authorship["institutions"]:
-                    authorship_ = authorship.copy()
-                    authorship_["institution_id"] = institution["id"]
-                    authorship_["institutions"] = [institution]
-                    authorships.append(authorship_)
-            self["authorships"] = authorships
-        return self
+                # shared base, only institution_id and institutions differ
+                base = {k: v for k, v in authorship.items()
+                        if k not in ("institution_id", "institutions")}
+                for institution in institutions:
+                    authorships.append({**base, "institution_id": institution["id"],
+                                        "institutions": [institution]})
+            data["authorships"] = authorships
+        return data
 
     @field_validator("best_oa_location")
     @classmethod
@@ -434,50 +533,125 @@ class Work(OpenAlexObject, SQLTable, validate_assignment=True):
         return value
 
 
+    @staticmethod
+    def _from_sql_args(args: dict, trusted: bool) -> "Work":
+        """Validate SQL args into a Work, or construct it as is if trusted.
+
+        Subtables are validated with the per-subtable `TypeAdapter`s.
+        """
+        id_ = args["id"]
+        for subtable in _WORK_SUBTABLES:
+            value = args.get(subtable)
+            if value is None:
+                continue
+            rows = _sql_subtable_rows(subtable, value, id_)
+            if not trusted:
+                args[subtable] = _SUBTABLE_ADAPTERS[subtable].validate_python(rows)
+                continue
+            subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
+            if subtable in MULTIVALUE:
+                args[subtable] = [subtable_cls.model_construct(**row) for row in rows]
+            else:
+                args[subtable] = subtable_cls.model_construct(**rows)
+        if not trusted:
+            return Work.model_validate(args, context=_FROM_SQL_CONTEXT)
+        return Work.model_construct(**args)
+
     @staticmethod
     def from_sql(t: tuple, conn: Optional[Connection] = None,
-                 subtables: Optional[dict] = None) -> "Work":
-        """Create Work from SQL."""
-        args = dict(zip(Work._sql_order.default, t))  # type: ignore
+                 subtables: Optional[dict] = None, trusted: bool = False) -> "Work":
+        """Create Work from SQL.
+
+        If `trusted=True`, rows are not validated again (they were on write),
+        the Work and its subtables are built with `model_construct`.
+        """
+        args = dict(zip(_WORK_SQL_ORDER, t))
         if conn is None:
             if subtables is None:  # only Work object
-                return Work(**args)
+                return Work._from_sql_args(args, trusted)
             else:  # Work object with subtables already queried
-                for subtable in Work._sql_subtables.default:  # type: ignore
+                for subtable in _WORK_SUBTABLES:
                     if subtable in subtables:
                         if subtable in ["referenced_works", "related_works"]:
                             args[subtable] = [t[1]
                                               for t in subtables[subtable]]
                         elif subtable in MULTIVALUE:
                             args[subtable] = [dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, t)  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], t)
                             )
                                 for t in subtables[subtable]]
                         else:
                             args[subtable] = dict(zip(
-                                SQL_TABLES_TO_CLASSES[subtable]._sql_order.default, subtables[subtable])  # type: ignore
+                                _SUBTABLE_ORDERS[subtable], subtables[subtable])
                             )
-            return Work(**args)
+            return Work._from_sql_args(args, trusted)
         else:  # Query everything, connection is provided
             id_ = t[0]
             with conn.cursor() as cursor:
-                for subtable in Work._sql_subtables.default:  # type: ignore
-                    subtable_cls = SQL_TABLES_TO_CLASSES[subtable]
+                for subtable in _WORK_SUBTABLES:
+                    # work_id is not selected, _preprocess replicates it
+                    columns = _SUBTABLE_ORDERS[subtable][1:]
+                    cursor.execute(_SUBTABLE_QUERIES[subtable], (id_,), prepare=True)
                     if subtable in MULTIVALUE:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE work_id = %s", (id_,))  # type: ignore
                         if subtable in ["referenced_works", "related_works"]:
-                            list_ = [t[1] for t in cursor.fetchall()]
+                            list_ = [t[0] for t in cursor]
                         else:
-                            list_ = [dict(zip(subtable_cls._sql_order.default, t))  # type: ignore
-                                     for t in cursor.fetchall()]
+                            list_ = [dict(zip(columns, t)) for t in cursor]
                         if len(list_) > 0:
                             args[subtable] = list_
                     else:
-                        cursor.execute(
-                            f"SELECT * FROM {subtable_cls._sql_table_name.default} WHERE work_id = %s", (id_,))  # type: ignore
                         t = cursor.fetchone()  # type: ignore
                         if t is not None:
-                            args[subtable] = dict(
-                                zip(subtable_cls._sql_order.default, t))  # type: ignore
-            return Work(**args)
+                            args[subtable] = dict(zip(columns, t))
+            return Work._from_sql_args(args, trusted)
+
+    @staticmethod
+    def from_sql_batch(ids: list[str], conn: Connection,
+                       trusted: bool = False) -> list["Work"]:
+        """Create Works from SQL, one query per table for the whole batch.
+
+        Subtable rows are fetched with `work_id = ANY(...)` and grouped by
+        work_id client-side. Works are returned in the order of `ids`,
+        missing ones are skipped.
+        """
+        found: dict[str, tuple] = {}
+        subtables: dict[str, dict] = {id_: {} for id_ in ids}
+        with conn.cursor(binary=True) as cursor:
+            cursor.execute(_WORK_BATCH_QUERY, (ids,), prepare=True)
+            for t in cursor:
+                found[t[0]] = t
+            for subtable in _WORK_SUBTABLES:
+                cursor.execute(_SUBTABLE_BATCH_QUERIES[subtable], (ids,), prepare=True)
+                for t in cursor:
+                    if subtable in MULTIVALUE:
+                        subtables[t[0]].setdefault(subtable, []).append(t)
+                    else:
+                        subtables[t[0]][subtable] = t
+        return [Work.from_sql(found[id_], subtables=subtables[id_], trusted=trusted)
+                for id_ in ids if id_ in found]
+
+    @staticmethod
+    def bulk_insert(works: list["Work"], conn: Connection) -> None:
+        """Insert Works and their subtables, one COPY per table.
+
+        Rows are gathered across all `works` per table first, the parent
+        table is written before its subtables. Does not commit.
+        """
+        rows: dict[type, list[tuple]] = defaultdict(list)
+        for work in works:
+            for table, values in iter_sql_rows(work):
+                rows[type(table)].append(values)
+        with conn.cursor() as cursor:
+            for table_cls, table_rows in rows.items():
+                with cursor.copy(f"COPY {_class_default(table_cls, '_sql_table_name')} "
+                                 f"{table_cls._sql_columns_str} FROM STDIN") as copy:
+                    for row in table_rows:
+                        copy.write_row(row)
+
+
+# Work's own columns and queries, looked up once like the subtables' above;
+# defined after the class, the methods only read them when called
+_WORK_SQL_ORDER = Work._sql_order_tuple
+_WORK_SUBTABLES = Work._sql_subtables_tuple
+_WORK_BATCH_QUERY = (f"SELECT {', '.join(_WORK_SQL_ORDER)} "
+                     f"FROM {Work._sql_table_name.default} WHERE id = ANY(%s)")  # type: ignore
@@ -0,0 +1,26 @@
+"""Shared test configuration."""
+import os
+
+from hypothesis import HealthCheck, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# select with HYPOTHESIS_PROFILE, "fast" for local runs,
+# "ci" keeps Hypothesis' default number of examples
+settings.register_profile(
+    "fast", max_examples=25, deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large])
+settings.register_profile("ci", max_examples=100)
+# a fixed, reproducible set of examples once the suite is stable
+settings.register_profile("canon", derandomize=True, max_examples=20)
+# scheduled runs, for discovering new failures
+settings.register_profile("nightly", max_examples=500)
+PROFILE = os.getenv("HYPOTHESIS_PROFILE", "fast")
+
+# under `pytest -n auto` each worker gets its own example database,
+# a shared one makes the workers contend for it
+if (WORKER := os.getenv("PYTEST_XDIST_WORKER")) is not None:
+    settings.register_profile(
+        "xdist", parent=settings.get_profile(PROFILE),
+        database=DirectoryBasedExampleDatabase(f".hypothesis/examples-{WORKER}"))
+    PROFILE = "xdist"
+settings.load_profile(PROFILE)
@@ -0,0 +1,15 @@
+"""Hypothesis strategies shared by the test modules."""
+from hypothesis import strategies as st
+
+# ASCII letters and digits for identifier-like fields, unicode is not
+# what they test and is slow to draw and shrink
+ID_CHARS = st.characters(min_codepoint=48, max_codepoint=122,
+                         categories=("Ll", "Lu", "Nd"))
+ID = st.text(alphabet=ID_CHARS, min_size=1, max_size=32)
+# bounded to realistic values, bare st.integers() favours huge ones
+COUNT = st.integers(min_value=0, max_value=10**9)
+YEAR = st.integers(min_value=1500, max_value=2100)
+# word positions in an abstract inverted index
+POSITION = st.integers(min_value=0, max_value=10_000)
+# MAG ids are stored as bigint
+MAG = st.integers(min_value=0, max_value=2**63 - 1)
@@ -1,33 +1,45 @@
 """Test authors module."""
-import re
+from datetime import timedelta, timezone
 
 from hypothesis import given, provisional
 from hypothesis import strategies as st
 from openalex_types.authors import Author  # type: ignore
+from strategies import COUNT  # type: ignore
 
-DATE_FMT = r"\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?\b"
+# a few fixed offsets instead of every IANA zone, much cheaper per example
+TIMEZONES = st.sampled_from(
+    [timezone.utc, timezone(timedelta(hours=-5)), timezone(timedelta(hours=9))])
 
 
 @given(id_=st.text(),
        orcid=st.one_of(st.none(), st.text()),
        display_name=st.one_of(st.none(), st.text()),
        display_name_alternatives=st.one_of(
-           st.none(), st.dictionaries(keys=st.text(), values=st.text())),
-       works_count=st.one_of(st.none(), st.integers()),
-       cited_by_count=st.integers(),
+           st.none(), st.lists(st.text())),
+       works_count=st.one_of(st.none(), COUNT),
+       cited_by_count=COUNT,
        last_known_institution=st.one_of(st.none(), st.text()),
        works_api_url=provisional.urls(),
-       updated_date=st.datetimes(timezones=st.timezones())
+       updated_date=st.datetimes(timezones=TIMEZONES),
+       created_date=st.datetimes(timezones=TIMEZONES)
        )
 def test_author_obj(id_, orcid, display_name, display_name_alternatives,
                     works_count, cited_by_count, last_known_institution,
-                    works_api_url, updated_date):
+                    works_api_url, updated_date, created_date):
     """Test Author object."""
     author = Author(id=id_, orcid=orcid, display_name=display_name,
                     display_name_alternatives=display_name_alternatives,
                     works_count=works_count, cited_by_count=cited_by_count,
                     last_known_institution=last_known_institution,
-                    works_api_url=works_api_url, updated_date=updated_date)
+                    works_api_url=works_api_url, updated_date=updated_date,
+                    created_date=created_date)
 
     assert author.id == id_
-    assert re.match(DATE_FMT, author.updated_date)
+    if display_name_alternatives is not None:
+        # quotation marks removed, empty lists become None
+        assert author.display_name_alternatives == (
+            [x.replace('"', "") for x in display_name_alternatives] or None)
+    # DateTimeNoTZ drops time zone and microseconds, Date8601 keeps them
+    assert author.updated_date == updated_date.replace(tzinfo=None, microsecond=0)
+    assert author.created_date == created_date
+    assert author.created_date.tzinfo is created_date.tzinfo
@@ -0,0 +1,51 @@
+"""Test common module."""
+from datetime import datetime
+
+import pyarrow as pa  # type: ignore
+import pytest
+from openalex_types.authors import Author  # type: ignore
+from openalex_types.common import sql_tables_to_arrow, sql_tables_to_df  # type: ignore
+from openalex_types.concepts import Concept  # type: ignore
+from openalex_types.institutions import Institution  # type: ignore
+from openalex_types.publishers import Publisher  # type: ignore
+from openalex_types.sources import Source  # type: ignore
+from openalex_types.works import Work  # type: ignore
+from pydantic import ValidationError
+
+PUBLISHERS = [
+    Publisher(id="https://openalex.org/P1", display_name="One",
+              parent_publisher={"id": "https://openalex.org/P0", "display_name": "Zero"},
+              works_count=3, updated_date="2024-01-02T03:04:05"),
+    Publisher(id="https://openalex.org/P2", display_name="Two"),
+]
+
+
+def test_sql_tables_to_df():
+    """Test one row per table and column per SQL column, nested models as dicts."""
+    df = sql_tables_to_df(PUBLISHERS)
+    assert list(df.columns) == list(Publisher._sql_order.default)
+    assert df["id"].tolist() == ["https://openalex.org/P1", "https://openalex.org/P2"]
+    assert df["parent_publisher"].tolist() == [
+        {"id": "https://openalex.org/P0", "display_name": "Zero"}, None]
+    assert df["updated_date"][0] == datetime(2024, 1, 2, 3, 4, 5)
+    assert sql_tables_to_df([]).empty
+
+
+def test_sql_tables_to_arrow():
+    """Test the arrow table matches the DataFrame, nested models as structs."""
+    table = sql_tables_to_arrow(PUBLISHERS)
+    assert table.column_names == list(Publisher._sql_order.default)
+    assert table.num_rows == 2
+    assert pa.types.is_struct(table.schema.field("parent_publisher").type)
+    assert table.column("parent_publisher").to_pylist() == [
+        {"id": "https://openalex.org/P0", "display_name": "Zero"}, None]
+    assert table.column("works_count").to_pylist() == [3, None]
+    assert sql_tables_to_arrow([]).num_rows == 0
+
+
+@pytest.mark.parametrize("model", [Author, Concept, Institution, Publisher, Source, Work])
+def test_models_frozen(model):
+    """Test the entities that never assign to themselves are frozen."""
+    obj = model(id="https://openalex.org/X1", display_name="X")
+    with pytest.raises(ValidationError):
+        obj.display_name = "Y"
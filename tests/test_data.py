@@ -0,0 +1,59 @@
+"""Test data module."""
+import gzip
+
+import pytest
+from openalex_types.data import SnapshotGZ, read_lines_parallel  # type: ignore
+
+N_LINES = 250
+
+
+@pytest.fixture
+def gz_files(tmp_path) -> list[SnapshotGZ]:
+    """Five GZ files of N_LINES numbered JSON lines each."""
+    files = []
+    for i in range(5):
+        path = tmp_path / f"part_{i:03}.gz"
+        with gzip.open(path, "wb") as f:
+            f.writelines(f'{{"file":{i},"line":{j}}}\n'.encode() for j in range(N_LINES))
+        files.append(SnapshotGZ(path))
+    return files
+
+
+def _expected(i: int) -> list[bytes]:
+    return [f'{{"file":{i},"line":{j}}}\n'.encode() for j in range(N_LINES)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 8])
+def test_read_lines_parallel_order(gz_files, max_workers):
+    """Test files come out in order, each with all its lines in order."""
+    lines = [list(it) for it in read_lines_parallel(
+        gz_files, max_workers=max_workers, chunk_size=16, max_chunks=2)]
+    assert lines == [_expected(i) for i in range(len(gz_files))]
+
+
+def test_read_lines_parallel_partial(gz_files):
+    """Test taking the next iterator stops the previous file, later files are whole."""
+    result = []
+    for i, it in enumerate(read_lines_parallel(gz_files, max_workers=2,
+                                               chunk_size=16, max_chunks=2)):
+        # first lines only of the even files
+        result.append([next(it) for _ in range(3)] if i % 2 == 0 else list(it))
+    assert result == [_expected(i)[:3] if i % 2 == 0 else _expected(i)
+                      for i in range(len(gz_files))]
+
+
+def test_read_lines_parallel_close(gz_files):
+    """Test closing the generator mid-file stops the workers."""
+    lines = read_lines_parallel(gz_files, max_workers=2, chunk_size=16, max_chunks=1)
+    assert next(next(lines)) == _expected(0)[0]
+    lines.close()  # would hang on a worker blocked on its full queue
+
+
+def test_read_lines_parallel_missing(gz_files, tmp_path):
+    """Test a missing file raises FileNotFoundError from its iterator."""
+    files = gz_files[:2] + [SnapshotGZ(tmp_path / "missing.gz")] + gz_files[2:]
+    lines = read_lines_parallel(files, max_workers=2)
+    assert list(next(lines)) == _expected(0)
+    assert list(next(lines)) == _expected(1)
+    with pytest.raises(FileNotFoundError):
+        list(next(lines))
@@ -0,0 +1,197 @@
+"""Test ingest module."""
+import re
+from datetime import datetime
+
+import msgspec
+import orjson
+import pytest
+from openalex_types import ingest  # type: ignore
+from openalex_types.authors import Author  # type: ignore
+from openalex_types.common import iter_sql_rows, unnest_params  # type: ignore
+from openalex_types.concepts import Concept  # type: ignore
+from openalex_types.institutions import Institution  # type: ignore
+from openalex_types.publishers import Publisher  # type: ignore
+from openalex_types.sources import Source  # type: ignore
+from openalex_types.topics import Topic  # type: ignore
+from openalex_types.works import Work  # type: ignore
+
+WORK_EXAMPLE = {
+    "id": "https://openalex.org/W1",
+    "doi": "https://doi.org/10.1/x",
+    "title": "A title",
+    "publication_year": 2020,
+    "publication_date": "2020-01-02",
+    "abstract_inverted_index": {"An": [0], "abstract": [1, 3], "short": [2]},
+    "ids": {"openalex": "https://openalex.org/W1", "mag": 3},
+    "primary_location": {"source": {"id": "S1"}, "is_oa": False},
+    "best_oa_location": {"source": None, "is_oa": True},
+    "locations": [{"source": {"id": "S1", "display_name": "Journal"},
+                   "is_oa": True, "version": "publishedVersion"}],
+    "authorships": [
+        {"author_position": "first", "author": {"id": "A1"},
+         "institutions": [{"id": "I1"}, {"id": "I2"}]},
+        {"author_position": "last", "author": {"id": "A2"}, "institutions": []},
+    ],
+    "biblio": {"volume": "1", "first_page": "10"},
+    "topics": [{"id": "T1", "score": 0.9}],
+    "concepts": [{"id": "C1", "score": 0.1}],
+    "mesh": [{"descriptor_ui": "D1", "is_major_topic": True}],
+    "open_access": {"is_oa": True, "oa_status": "gold"},
+    "referenced_works": ["W2", "W3"],
+    "related_works": ["W4"],
+    "not_a_column": {"a": 1},
+}
+
+AUTHOR_EXAMPLE = {
+    "id": "https://openalex.org/A1",
+    "display_name": "Name",
+    "display_name_alternatives": ['"Nick" Name'],
+    "works_count": 3,
+    "ids": {"openalex": "https://openalex.org/A1", "mag": 7},
+    "counts_by_year": [{"year": 2020, "works_count": 1}],
+}
+
+CONCEPT_EXAMPLE = {
+    "id": "https://openalex.org/C1",
+    "wikidata": "https://www.wikidata.org/wiki/Q1",
+    "display_name": "Concept",
+    "level": 1,
+    "description": "A concept",
+    "works_count": 10,
+    "cited_by_count": 20,
+    "image_url": "https://example.com/c.png",
+    "works_api_url": "https://api.openalex.org/works?filter=concepts.id:C1",
+    "updated_date": "2024-01-02T03:04:05.678",
+    "ids": {"openalex": "https://openalex.org/C1", "mag": 1, "wikipedia": "w"},
+    "ancestors": [{"id": "https://openalex.org/C0", "display_name": "Root", "level": 0}],
+    "related_concepts": [{"id": "https://openalex.org/C2", "display_name": "Other",
+                          "level": 1, "score": 0.5}],
+    "counts_by_year": [{"year": 2020, "works_count": 1, "cited_by_count": 2}],
+}
+
+INSTITUTION_EXAMPLE = {
+    "id": "https://openalex.org/I1",
+    "ror": "https://ror.org/1",
+    "display_name": "University",
+    "country_code": "US",
+    "type": "education",
+    "homepage_url": "https://example.edu",
+    "display_name_acronyms": ["U"],
+    "display_name_alternatives": ["The University"],
+    "works_count": 5,
+    "cited_by_count": 6,
+    "works_api_url": "https://api.openalex.org/works?filter=institutions.id:I1",
+    "updated_date": "2024-01-02T03:04:05",
+    "ids": {"openalex": "https://openalex.org/I1", "ror": "https://ror.org/1", "mag": 2},
+    "geo": {"city": "City", "country_code": "US", "country": "United States",
+            "latitude": 1.5, "longitude": -2.5},
+    "associated_institutions": [{"id": "https://openalex.org/I2", "relationship": "child"}],
+    "counts_by_year": [{"year": 2021, "works_count": 3}],
+}
+
+PUBLISHER_EXAMPLE = {
+    "id": "https://openalex.org/P1",
+    "display_name": "Publisher",
+    "alternate_titles": ["Pub"],
+    "country_codes": ["US", "GB"],
+    "hierarchy_level": 1,
+    "parent_publisher": {"id": "https://openalex.org/P0", "display_name": "Parent"},
+    "works_count": 7,
+    "cited_by_count": 8,
+    "sources_api_url": "https://api.openalex.org/sources?filter=host_organization.id:P1",
+    "updated_date": "2024-01-02T03:04:05",
+    "ids": {"openalex": "https://openalex.org/P1", "ror": "https://ror.org/2"},
+    "counts_by_year": [{"year": 2022, "works_count": 4}],
+}
+
+SOURCE_EXAMPLE = {
+    "id": "https://openalex.org/S1",
+    "issn_l": "1234-5678",
+    "issn": ["1234-5678", "8765-4321"],
+    "display_name": "Journal",
+    "works_count": 9,
+    "cited_by_count": 10,
+    "is_oa": True,
+    "is_in_doaj": False,
+    "homepage_url": "https://example.com/journal",
+    "works_api_url": "https://api.openalex.org/works?filter=primary_location.source.id:S1",
+    "updated_date": "2024-01-02T03:04:05",
+    "ids": {"openalex": "https://openalex.org/S1", "issn_l": "1234-5678",
+            "issn": ["1234-5678"], "mag": 3},
+    "counts_by_year": [{"year": 2023, "works_count": 5, "cited_by_count": 1}],
+}
+
+TOPIC_EXAMPLE = {
+    "id": "https://openalex.org/T1",
+    "display_name": "Topic",
+    "description": "A topic",
+    "keywords": ["one", "two"],
+    "works_api_url": "https://api.openalex.org/works?filter=topics.id:T1",
+    "works_count": 11,
+    "cited_by_count": 12,
+    "updated_date": "2024-01-02T03:04:05",
+    "domain": {"id": "https://openalex.org/domains/1", "display_name": "Domain"},
+    "field": {"id": "https://openalex.org/fields/2", "display_name": "Field"},
+    "subfield": {"id": "https://openalex.org/subfields/3", "display_name": "Subfield"},
+}
+
+# (ingest mirror, Pydantic model, example line) of every entity
+ENTITIES = [
+    (ingest.Work, Work, WORK_EXAMPLE),
+    (ingest.Author, Author, AUTHOR_EXAMPLE),
+    (ingest.Concept, Concept, CONCEPT_EXAMPLE),
+    (ingest.Institution, Institution, INSTITUTION_EXAMPLE),
+    (ingest.Publisher, Publisher, PUBLISHER_EXAMPLE),
+    (ingest.Source, Source, SOURCE_EXAMPLE),
+    (ingest.Topic, Topic, TOPIC_EXAMPLE),
+]
+
+
+def _rows(obj) -> list[tuple]:
+    return [(t._sql_table_name, values) for t, values in iter_sql_rows(obj)]
+
+
+@pytest.mark.parametrize("struct,model,example", ENTITIES,
+                         ids=[e[1].__name__ for e in ENTITIES])
+def test_rows_match_pydantic(struct, model, example):
+    """Test the ingest mirror yields the same SQL rows as the Pydantic model."""
+    line = orjson.dumps(example)
+    assert _rows(msgspec.json.decode(line, type=struct)) == _rows(
+        model(**orjson.loads(line)))
+
+
+def _unnest_types(table) -> dict[str, str]:
+    """SQL type each column is cast to in the table's `sql_unnest`."""
+    table._compile_unnest()
+    casts = re.findall(r"%s::([\w ]+)\[\]", table._sql_unnest_str)
+    return dict(zip(table._sql_order_tuple, casts))
+
+
+@pytest.mark.parametrize("table,column", [
+    (ingest.Work, "publication_date"),
+    (ingest.Author, "updated_date"),
+    (ingest.Concept, "updated_date"),
+    (ingest.Institution, "updated_date"),
+    (ingest.Publisher, "updated_date"),
+    (ingest.Source, "updated_date"),
+    (ingest.Topic, "updated_date"),
+])
+def test_unnest_date_columns(table, column):
+    """Test date columns are sent as timestamps by `sql_unnest`."""
+    assert _unnest_types(table)[column] == "timestamp"
+
+
+@pytest.mark.parametrize("struct,model,example", ENTITIES,
+                         ids=[e[1].__name__ for e in ENTITIES])
+def test_unnest_matches_pydantic(struct, model, example):
+    """Test ingest and Pydantic tables build the same `sql_unnest`, dates included."""
+    table = msgspec.json.decode(orjson.dumps(example), type=struct)
+    assert table.sql_unnest == model(**orjson.loads(orjson.dumps(example))).sql_unnest
+
+
+def test_unnest_params_dates():
+    """Test the bound date column holds the parsed datetimes."""
+    work = msgspec.json.decode(orjson.dumps(WORK_EXAMPLE), type=ingest.Work)
+    columns = unnest_params([work.to_sql_values()], work._sql_unnest_json)
+    assert columns[work._sql_order_tuple.index("publication_date")] == [
+        datetime(2020, 1, 2)]
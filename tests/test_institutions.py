@@ -1,9 +1,7 @@
 """Test institutions module."""
 # pylint: disable=R0913
-import re
-
 import pytest
-from hypothesis import given, provisional
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 from openalex_types.institutions import (  # type: ignore
     Institution,
@@ -12,24 +10,49 @@ from openalex_types.institutions import (  # type: ignore
     InstitutionGeo,
     InstitutionIDs,
 )
-from pydantic import AnyUrl, ValidationError
+from pydantic import TypeAdapter, ValidationError
+from strategies import COUNT, ID, MAG, YEAR  # type: ignore
+
+# strategies shared by the tests below, built once at import
+_TEXT = st.text()
+_OPT_TEXT = st.one_of(st.none(), _TEXT)
+_OPT_ID = st.one_of(st.none(), ID)
+_TEXT_LIST = st.lists(_TEXT)
+_OPT_TEXT_LIST = st.one_of(st.none(), _TEXT_LIST)
+_OPT_COUNT = st.one_of(st.none(), COUNT)
+_OPT_MAG = st.one_of(st.none(), MAG)
+# URLs drawn from a fixed pool, generating them per draw is slow
+_URL_POOL = [f"https://host{i}.example.com/p{i}" for i in range(256)] + [
+    "http://a.b", "https://x.y/z?q=1"]
+_URL = st.sampled_from(_URL_POOL)
+_OPT_URL = st.one_of(st.none(), _URL)
+_COUNTRY = st.sampled_from(["US", "CA", "MX"])
+_LATLON = st.one_of(st.none(), st.floats(allow_nan=False))
+_DT = st.datetimes(timezones=st.timezones())
+_COUNTS = st.lists(st.fixed_dictionaries({
+    "year": YEAR, "works_count": COUNT, "cited_by_count": _OPT_COUNT}))
+_ASSOCIATED = st.lists(st.fixed_dictionaries({
+    "associated_institution_id": ID, "relationship": ID}))
 
-DATE_FMT = r"\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?\b"
+# validators of the subtable lists, built once for all examples
+_COUNTS_TA = TypeAdapter(list[InstitutionCountByYear])
+_ASSOC_TA = TypeAdapter(list[InstitutionAssociatedInstitution])
 
 
-@given(id_=st.text(),
-       ror=st.one_of(st.none(), st.text()),
-       country_code=st.sampled_from(["US", "CA", "MX"]),
-       type_=st.one_of(st.none(), st.text()),
-       homepage_url=st.one_of(st.none(), provisional.urls()),
-       image_url=provisional.urls(),
-       image_thumbnail_url=provisional.urls(),
-       display_name_acronyms=st.lists(st.text()),
-       display_name_alternatives=st.one_of(st.none(), st.lists(st.text())),
-       works_count=st.integers(),
-       cited_by_count=st.one_of(st.none(), st.integers()),
-       works_api_url=provisional.urls(),
-       updated_date=st.datetimes(timezones=st.timezones()),
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(id_=ID,
+       ror=_OPT_ID,
+       country_code=_COUNTRY,
+       type_=_OPT_ID,
+       homepage_url=_OPT_URL,
+       image_url=_URL,
+       image_thumbnail_url=_URL,
+       display_name_acronyms=_TEXT_LIST,
+       display_name_alternatives=_OPT_TEXT_LIST,
+       works_count=COUNT,
+       cited_by_count=_OPT_COUNT,
+       works_api_url=_URL,
+       updated_date=_DT,
        )
 def test_inst_no_other_objs(
     id_,
@@ -67,24 +90,25 @@ def test_inst_no_other_objs(
     assert inst.country_code == country_code
     assert inst.type == type_
     if homepage_url:
-        assert isinstance(inst.homepage_url, AnyUrl)
-    assert isinstance(inst.image_url, AnyUrl)
-    assert isinstance(inst.image_thumbnail_url, AnyUrl)
-    assert inst.display_name_acronyms == display_name_acronyms
-    assert inst.display_name_alternatives == display_name_alternatives
+        assert inst.homepage_url == homepage_url
+    assert inst.image_url == image_url
+    assert inst.image_thumbnail_url == image_thumbnail_url
+    # empty lists become None
+    assert inst.display_name_acronyms == (display_name_acronyms or None)
+    assert inst.display_name_alternatives == (display_name_alternatives or None)
     assert inst.works_count == works_count
     assert inst.cited_by_count == cited_by_count
-    assert isinstance(inst.works_api_url, AnyUrl)
-    assert re.match(DATE_FMT, inst.updated_date)
+    assert inst.works_api_url == works_api_url
+    assert inst.updated_date == updated_date.replace(tzinfo=None, microsecond=0)
     assert isinstance(inst, Institution)
 
 
-@given(id_=st.text(),
-       openalex=st.one_of(st.none(), st.text()),
-       ror=st.text(),
-       wikidata=st.text(),
-       wikipedia=st.text(),
-       mag=st.one_of(st.none(), st.integers()),
+@given(id_=ID,
+       openalex=_OPT_ID,
+       ror=ID,
+       wikidata=ID,
+       wikipedia=ID,
+       mag=_OPT_MAG,
        )
 def test_inst_ids(id_, openalex, ror, wikidata, wikipedia, mag):
     """Test InstitutionIDs."""
@@ -106,14 +130,14 @@ def test_inst_ids(id_, openalex, ror, wikidata, wikipedia, mag):
 
 
 @given(
-    institution_id=st.text(),
-    city=st.one_of(st.none(), st.text()),
-    geonames_city_id=st.one_of(st.none(), st.text()),
-    region=st.one_of(st.none(), st.text()),
-    country_code=st.sampled_from(["US", "CA", "MX"]),
-    country=st.one_of(st.none(), st.text()),
-    latitude=st.one_of(st.none(), st.floats(allow_nan=False)),
-    longitude=st.one_of(st.none(), st.floats(allow_nan=False)),
+    institution_id=ID,
+    city=_OPT_TEXT,
+    geonames_city_id=_OPT_ID,
+    region=_OPT_TEXT,
+    country_code=_COUNTRY,
+    country=_OPT_TEXT,
+    latitude=_LATLON,
+    longitude=_LATLON,
 )
 def test_inst_geo(institution_id,
                   city, geonames_city_id, region, country_code, country, latitude, longitude):
@@ -140,10 +164,10 @@ def test_inst_geo(institution_id,
 
 
 @given(
-    institution_id=st.text(),
-    year=st.integers(),
-    works_count=st.one_of(st.none(), st.integers()),
-    cited_by_count=st.integers(),
+    institution_id=ID,
+    year=YEAR,
+    works_count=_OPT_COUNT,
+    cited_by_count=COUNT,
 )
 def test_inst_count(institution_id, year, works_count, cited_by_count):
     """Test InstitutionCountByYear."""
@@ -166,9 +190,9 @@ def test_inst_count_no_year():
         InstitutionCountByYear(institution_id="http://l:1")
 
 
-@given(institution_id=st.text(),
+@given(institution_id=ID,
        associated_institution_id=st.text(min_size=2),
-       relationship=st.text(),
+       relationship=ID,
        )
 def test_inst_associated_inst_no_alias(institution_id, associated_institution_id, relationship):
     """Test InstitutionAssociatedInstitution no alias.
@@ -184,9 +208,9 @@ def test_inst_associated_inst_no_alias(institution_id, associated_institution_id
     assert isinstance(inst_assoc_inst, InstitutionAssociatedInstitution)
 
 
-@given(institution_id=st.text(),
-       associated_institution_id=st.text(),
-       relationship=st.text(),
+@given(institution_id=ID,
+       associated_institution_id=ID,
+       relationship=ID,
        )
 def test_inst_associated_inst(institution_id, associated_institution_id, relationship):
     """Test InstitutionAssociatedInstitution."""
@@ -201,40 +225,32 @@ def test_inst_associated_inst(institution_id, associated_institution_id, relatio
     assert isinstance(inst_assoc_inst, InstitutionAssociatedInstitution)
 
 
-@given(id_=st.text(),
-       ror=st.one_of(st.none(), st.text()),
-       country_code=st.sampled_from(["US", "CA", "MX"]),
-       type_=st.one_of(st.none(), st.text()),
-       homepage_url=st.one_of(st.none(), provisional.urls()),
-       image_url=provisional.urls(),
-       image_thumbnail_url=provisional.urls(),
-       display_name_acronyms=st.lists(st.text()),
-       display_name_alternatives=st.one_of(st.none(), st.lists(st.text())),
-       works_count=st.integers(),
-       cited_by_count=st.one_of(st.none(), st.integers()),
-       works_api_url=provisional.urls(),
-       updated_date=st.datetimes(timezones=st.timezones()),
-       city=st.one_of(st.none(), st.text()),
-       geonames_city_id=st.one_of(st.none(), st.text()),
-       region=st.one_of(st.none(), st.text()),
-       country_code=st.sampled_from(["US", "CA", "MX"]),
-       country=st.one_of(st.none(), st.text()),
-       latitude=st.one_of(st.none(), st.floats(allow_nan=False)),
-       longitude=st.one_of(st.none(), st.floats(allow_nan=False)),
-       openalex=st.one_of(st.none(), st.text()),
-       wikidata=st.text(),
-       wikipedia=st.text(),
-       mag=st.one_of(st.none(), st.integers()),
-       counts_by_year=st.lists(st.builds(
-           dict,
-           year=st.integers(),
-           works_count=st.integers(),
-           cited_by_count=st.one_of(st.none(), st.integers()))),
-       associated_institutions=st.lists(st.builds(
-           dict,
-           associated_institution_id=st.text(),
-           relationship=st.text(),
-       ))
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(id_=ID,
+       ror=_OPT_ID,
+       country_code=_COUNTRY,
+       type_=_OPT_ID,
+       homepage_url=_OPT_URL,
+       image_url=_URL,
+       image_thumbnail_url=_URL,
+       display_name_acronyms=_TEXT_LIST,
+       display_name_alternatives=_OPT_TEXT_LIST,
+       works_count=COUNT,
+       cited_by_count=_OPT_COUNT,
+       works_api_url=_URL,
+       updated_date=_DT,
+       city=_OPT_TEXT,
+       geonames_city_id=_OPT_ID,
+       region=_OPT_TEXT,
+       country=_OPT_TEXT,
+       latitude=_LATLON,
+       longitude=_LATLON,
+       openalex=_OPT_ID,
+       wikidata=ID,
+       wikipedia=ID,
+       mag=_OPT_MAG,
+       counts_by_year=_COUNTS,
+       associated_institutions=_ASSOCIATED
        )
 def test_inst_complete(
     id_,
@@ -253,7 +269,6 @@ def test_inst_complete(
     city,
     geonames_city_id,
     region,
-    country_codes,
     country,
     latitude,
     longitude,
@@ -283,7 +298,7 @@ def test_inst_complete(
                "city": city,
                "geonames_city_id": geonames_city_id,
                "region": region,
-               "country_code": country_codes,
+               "country_code": country_code,
                "country": country,
                "latitude": latitude,
                "longitude": longitude,
@@ -303,21 +318,89 @@ def test_inst_complete(
     assert inst.country_code == country_code
     assert inst.type == type_
     if homepage_url:
-        assert isinstance(inst.homepage_url, AnyUrl)
-    assert isinstance(inst.image_url, AnyUrl)
-    assert isinstance(inst.image_thumbnail_url, AnyUrl)
-    assert inst.display_name_acronyms == display_name_acronyms
-    assert inst.display_name_alternatives == display_name_alternatives
+        assert inst.homepage_url == homepage_url
+    assert inst.image_url == image_url
+    assert inst.image_thumbnail_url == image_thumbnail_url
+    # empty lists become None
+    assert inst.display_name_acronyms == (display_name_acronyms or None)
+    assert inst.display_name_alternatives == (display_name_alternatives or None)
     assert inst.works_count == works_count
     assert inst.cited_by_count == cited_by_count
-    assert isinstance(inst.works_api_url, AnyUrl)
-    assert re.match(DATE_FMT, inst.updated_date)
-    for count_by_year in inst.counts_by_year:  # pylint: disable=not-an-iterable
-        assert isinstance(count_by_year, InstitutionCountByYear)
-        assert count_by_year.institution_id == id_
-    for as_inst in inst.associated_institutions:  # pylint: disable=not-an-iterable
-        assert isinstance(as_inst, InstitutionAssociatedInstitution)
-        assert as_inst.institution_id == id_
-        assert isinstance(as_inst.associated_institution_id, str)
+    assert inst.works_api_url == works_api_url
+    assert inst.updated_date == updated_date.replace(tzinfo=None, microsecond=0)
+    assert all(isinstance(c, InstitutionCountByYear) and c.institution_id == id_
+               for c in inst.counts_by_year or ())
+    assert all(isinstance(a, InstitutionAssociatedInstitution) and a.institution_id == id_
+               and isinstance(a.associated_institution_id, str)
+               for a in inst.associated_institutions or ())
     assert inst.ids.institution_id == id_
     assert inst.geo.institution_id == id_
+
+
+@given(id_=ID,
+       ror=_OPT_ID,
+       country_code=_COUNTRY,
+       works_count=COUNT,
+       cited_by_count=_OPT_COUNT,
+       city=_OPT_TEXT,
+       latitude=_LATLON,
+       longitude=_LATLON,
+       openalex=_OPT_ID,
+       wikidata=ID,
+       mag=_OPT_MAG,
+       counts_by_year=_COUNTS,
+       associated_institutions=_ASSOCIATED,
+       )
+def test_inst_construct_passthrough(
+    id_,
+    ror,
+    country_code,
+    works_count,
+    cited_by_count,
+    city,
+    latitude,
+    longitude,
+    openalex,
+    wikidata,
+    mag,
+    counts_by_year,
+    associated_institutions,
+):
+    """Test Institution.model_construct with trusted, pre-built subtables.
+      (validation is covered by `test_inst_complete`)."""
+    # subtable lists validated in one call each
+    counts = _COUNTS_TA.validate_python(
+        [{**c, "institution_id": id_} for c in counts_by_year])
+    associated = _ASSOC_TA.validate_python(
+        [{**a, "institution_id": id_} for a in associated_institutions])
+    geo = InstitutionGeo.model_construct(
+        institution_id=id_, city=city, country_code=country_code,
+        latitude=latitude, longitude=longitude)
+    ids = InstitutionIDs.model_construct(
+        institution_id=id_, openalex=openalex, wikidata=wikidata, mag=mag)
+    inst = Institution.model_construct(
+        id=id_,
+        ror=ror,
+        country_code=country_code,
+        works_count=works_count,
+        cited_by_count=cited_by_count,
+        geo=geo,
+        ids=ids,
+        counts_by_year=counts,
+        associated_institutions=associated,
+    )
+    assert inst.id == id_
+    assert inst.ror == ror
+    assert inst.country_code == country_code
+    assert inst.works_count == works_count
+    assert inst.cited_by_count == cited_by_count
+    assert inst.geo is geo
+    assert inst.geo.institution_id == id_
+    assert inst.geo.latitude == latitude
+    assert inst.ids is ids
+    assert inst.ids.mag == mag
+    assert inst.counts_by_year is counts
+    assert all(isinstance(c, InstitutionCountByYear) and c.institution_id == id_
+               for c in inst.counts_by_year)
+    assert inst.associated_institutions is associated
+    assert all(a.institution_id == id_ for a in inst.associated_institutions)
@@ -1,77 +1,233 @@
 """Test works module."""
 # pylint: disable=R0913, E1133, R0914
 import re
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
 
+import numpy as np
+import psycopg
 import pytest
-from hypothesis import given, provisional, settings
+from hypothesis import HealthCheck, given, provisional, settings
 from hypothesis import strategies as st
 from openalex_types.works import (  # type: ignore
+    NOMIC_EMBED_DIM,
+    NomicEmbedText768,
     Work,
+    WorkAuthorship,
+    WorkBiblio,
+    WorkConcept,
+    WorkIDs,
+    WorkLocation,
+    WorkMesh,
+    WorkOpenAccess,
+    WorkReferencedWork,
+    WorkRelatedWork,
+    WorkTopic,
+    _FROM_SQL_CONTEXT,
+    _SUBTABLE_BATCH_QUERIES,
+    _WORK_BATCH_QUERY,
     _construct_abstract_from_index,
-    _construct_dict_from_id,
+    _ref_dict,
+    _rel_dict,
 )
-from pydantic import AnyUrl, ValidationError
+from pgvector.psycopg.vector import register_vector_info
+from psycopg.adapt import AdaptersMap, PyFormat, Transformer
+from psycopg.types import TypeInfo
+from pydantic import AnyUrl, TypeAdapter, ValidationError
+from strategies import COUNT, ID, ID_CHARS, MAG, POSITION, YEAR  # type: ignore
 
-DATE_FMT = r"\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?\b"
+_get_wid = attrgetter("work_id")
+
+
+def _all_wid(items, id_: str) -> bool:
+    """Whether every subtable row points back to work `id_`."""
+    return all(wid == id_ for wid in map(_get_wid, items))
+
+
+# one validator for whole batches of Works
+_WORKS_TA = TypeAdapter(list[Work])
 
 TEXT_EXAMPLE = "Accelerate discovery and advance organizational success through emerging technologies and renowned research talent. Working with Axle, our clients can deploy cutting-edge solutions and services that push the pace of progress and expand the limits of possibility. Advance. Accelerate. Achieve."
 
-words = re.findall(r"\b[\w-]+\b[,\.]?", TEXT_EXAMPLE)
+_WORD_RE = re.compile(r"\b[\w-]+\b[,\.]?")
+
+_index: defaultdict[str, list[int]] = defaultdict(list)
+for i, word in enumerate(_WORD_RE.findall(TEXT_EXAMPLE)):
+    _index[sys.intern(word)].append(i)
+# read-only, shared by every test that uses it
+REVERSED_INDEX_EXAMPLE: Mapping[str, list[int]] = MappingProxyType(dict(_index))
+
+
+@pytest.fixture(scope="session")
+def ref_work() -> Work:
+    """Reference Work with fixed inputs, built once per session."""
+    return Work(
+        id="W1",
+        doi="10.1/ref",
+        ids={"openalex": "W1", "doi": "10.1/ref", "mag": 1},
+        authorships=[{"author_id": "A1", "author_position": "first",
+                      "institutions": [{"id": "I1"}, {"id": "I2"}]}],
+        biblio={"volume": "1", "first_page": "1", "last_page": "2"},
+        topics=[{"topic_id": "T1", "score": 0.5}],
+        concepts=[{"concept_id": "C1", "score": 0.5}],
+        mesh=[{"descriptor_ui": "D1", "descriptor_name": "d",
+               "is_major_topic": True, "qualifier_ui": ""}],
+        locations=[{"source_id": "S1", "version": "publishedVersion"}],
+        open_access={"is_oa": True, "oa_status": "gold"},
+        referenced_works=["W2", "W3"],
+        related_works=["W4"],
+    )
+
+
+def test_work_structure(ref_work: Work):
+    """Test the types of the subtables of a Work, once for the session.
+      (`test_work` checks the invariants that depend on its inputs)."""
+    assert isinstance(ref_work.ids, WorkIDs)
+    assert isinstance(ref_work.biblio, WorkBiblio)
+    assert isinstance(ref_work.open_access, WorkOpenAccess)
+    for rows, cls in ((ref_work.authorships, WorkAuthorship),
+                      (ref_work.topics, WorkTopic),
+                      (ref_work.concepts, WorkConcept),
+                      (ref_work.mesh, WorkMesh),
+                      (ref_work.locations, WorkLocation),
+                      (ref_work.referenced_works, WorkReferencedWork),
+                      (ref_work.related_works, WorkRelatedWork)):
+        assert rows and all(isinstance(row, cls) for row in rows)
+        assert _all_wid(rows, "W1")
+    # one authorship per institution
+    assert [a.institution_id for a in ref_work.authorships] == ["I1", "I2"]
+    assert [r.referenced_work_id for r in ref_work.referenced_works] == ["W2", "W3"]
+    assert all(isinstance(r.related_work_id, str) for r in ref_work.related_works)
+
+
+def test_location_source_id():
+    """Test a location built on its own takes source_id from its source."""
+    location = WorkLocation(**{"source": {"id": "S1", "display_name": "J"}, "is_oa": True})
+    assert location.source_id == "S1"
+    assert WorkLocation(is_oa=True).source_id is None
+
+
+def test_nomic_embedding():
+    """Test the embedding compares by value and renders as a vector literal."""
+    values = [0.5, -1.0] + [0.0] * (NOMIC_EMBED_DIM - 2)
+    embedding = NomicEmbedText768(work_id="W1", embedding=values)
+    assert embedding == NomicEmbedText768(work_id="W1", embedding=values)
+    assert embedding == NomicEmbedText768(
+        work_id="W1", embedding=np.asarray(values, dtype=np.float32).tobytes())
+    assert embedding != NomicEmbedText768(work_id="W1", embedding=values[::-1])
+    assert embedding != NomicEmbedText768(work_id="W1")
+    assert embedding.sql_values.startswith("('W1', '[0.5,-1.0,0.0,")
+    assert embedding.model_dump()["embedding"] == values
+    assert "%s::vector[]" in embedding.sql_unnest
+    schema = NomicEmbedText768.model_json_schema()["properties"]["embedding"]
+    assert {"type": "array", "items": {"type": "number"},
+            "minItems": NOMIC_EMBED_DIM, "maxItems": NOMIC_EMBED_DIM} in schema["anyOf"]
 
-REVERSED_INDEX_EXAMPLE: dict[str, list[int]] = {}
 
-for i, word in enumerate(words):
-    if word not in REVERSED_INDEX_EXAMPLE:
-        REVERSED_INDEX_EXAMPLE[word] = []
-    REVERSED_INDEX_EXAMPLE[word].append(i)
+@pytest.mark.parametrize("value", [[[1.0, 2.0], [3.0, 4.0]], [1.0, 2.0],
+                                   [0.0] * (NOMIC_EMBED_DIM + 1)])
+def test_nomic_embedding_shape(value):
+    """Test only flat embeddings of NOMIC_EMBED_DIM floats validate."""
+    with pytest.raises(ValidationError):
+        NomicEmbedText768(work_id="W1", embedding=value)
 
 
-def test_construct_abstract_from_index():
+def test_nomic_embedding_pgvector_dump():
+    """Test the SQL value dumps as a vector once pgvector is registered.
+
+    Plain psycopg can not adapt an ndarray, connections need
+    `pgvector.psycopg.register_vector`, here applied offline.
+    """
+    values = [0.5, -1.0] + [0.0] * (NOMIC_EMBED_DIM - 2)
+    _, embedding = NomicEmbedText768(work_id="W1", embedding=values).to_sql_values()
+    context = SimpleNamespace(adapters=AdaptersMap(psycopg.adapters), connection=None)
+    with pytest.raises(psycopg.ProgrammingError):
+        Transformer(context).get_dumper(embedding, PyFormat.AUTO)
+    register_vector_info(context, TypeInfo("vector", 100_000, 100_001))
+    dumper = Transformer(context).get_dumper(embedding, PyFormat.TEXT)
+    assert dumper.oid == 100_000
+    assert bytes(dumper.dump(embedding)).startswith(b"[0.5,-1.0,0.0,")
+
+
+def test_work_no_id():
+    """Test a Work without id fails validation, not preprocessing."""
+    with pytest.raises(ValidationError):
+        Work(doi="10.1/x", authorships=[{"author_id": "A1"}], referenced_works=["W2"])
+
+
+@pytest.mark.parametrize("text,index", [
+    ("", {}),
+    ("hello", {"hello": [0]}),
+    # words without positions are skipped, a repeated position keeps the last
+    ("hello", {"hello": [0], "unused": []}),
+    ("b", {"a": [0], "b": [0]}),
+    ("hello world", {"hello": [0], "world": [1]}),
+    ("a a b", {"a": [0, 1], "b": [2]}),
+    ("Über café naïve café", {"Über": [0], "café": [1, 3], "naïve": [2]}),
+    # sparse (truncated) index, words joined in position order
+    ("start middle end", {"end": [5000], "start": [0], "middle": [70]}),
+    ("start end", {"start": [0], "lost": [5000], "end": [5000]}),
+    (TEXT_EXAMPLE, REVERSED_INDEX_EXAMPLE),
+])
+def test_construct_abstract_from_index(text, index):
     """Test construct abstract from index."""
-    assert _construct_abstract_from_index(
-        REVERSED_INDEX_EXAMPLE) == TEXT_EXAMPLE
+    assert _construct_abstract_from_index(index) == text
 
 
-def test_construct_dict_from_id():
-    """Test construct dict from ID."""
-    assert _construct_dict_from_id("work_id", "other_id") == {
-        "id": "other_id", "work_id": "work_id"}
+@pytest.mark.parametrize("func,args,expected", [
+    (_ref_dict, ("work_id", "other_id"),
+     {"referenced_work_id": "other_id", "work_id": "work_id"}),
+    (_rel_dict, ("W1", "W2"), {"related_work_id": "W2", "work_id": "W1"}),
+])
+def test_ref_rel_dict(func, args, expected):
+    """Test referenced and related work rows as dicts."""
+    assert func(*args) == expected
 
 
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
 @given(
-    id_=st.text(min_size=1),
-    doi=st.text(min_size=1),
+    id_=ID,
+    doi=ID,
     title=st.one_of(st.none(), st.text(min_size=1)),
     display_name=st.one_of(st.none(), st.text(min_size=1)),
-    publication_year=st.one_of(st.none(), st.integers()),
+    publication_year=st.one_of(st.none(), YEAR),
     publication_date=st.dates(),
-    type_=st.text(min_size=1),
-    cited_by_count=st.one_of(st.none(), st.integers()),
+    type_=ID,
+    cited_by_count=st.one_of(st.none(), COUNT),
     is_retracted=st.one_of(st.none(), st.booleans()),
     is_paratext=st.booleans(),
     cited_by_api_url=st.one_of(st.none(), provisional.urls()),
-    abstract_inverted_index=st.builds(dict, st.lists(
-        st.tuples(st.text(min_size=1), st.lists(st.integers())))),
+    abstract_inverted_index=st.dictionaries(
+        st.text(min_size=1), st.lists(POSITION)),
     language=st.one_of(
         st.none(), st.text(min_size=1)),
-    ids=st.builds(dict, openalex=st.text(min_size=1),
-                  doi=st.text(min_size=1), mag=st.integers()),
-    authorships=st.lists(st.builds(dict, author_id=st.text(min_size=1),
-                                   author_position=st.text(), raw_affiliation_string=st.text(min_size=8))),
-    biblio=st.builds(dict, volume=st.text(),
-                     first_page=st.text(), last_page=st.text()),
-    topics=st.lists(st.builds(dict, topic_id=st.text(
-        min_size=1), score=st.floats())),
-    concepts=st.lists(
-        st.builds(dict, concept_id=st.text(min_size=1), score=st.floats())),
-    mesh=st.lists(st.builds(dict, descriptor_ui=st.text(
-        min_size=1), descriptor_name=st.text(min_size=1), is_major_topic=st.booleans(), qualifier_ui=st.text())),
-    locations=st.lists(st.builds(dict, source_id=st.text(
-        min_size=1), pdf_url=provisional.urls(), version=st.text(min_size=1))),
-    open_access=st.builds(dict, is_oa=st.booleans(),
-                          oa_status=st.text(min_size=1)),
-    referenced_works=st.lists(st.text(min_size=5)),
-    related_works=st.lists(st.text(min_size=5)),
+    ids=st.fixed_dictionaries({
+        "openalex": ID, "doi": ID, "mag": MAG}),
+    authorships=st.lists(st.fixed_dictionaries({
+        "author_id": ID,
+        "author_position": st.sampled_from(["first", "middle", "last"]),
+        "raw_affiliation_string": st.text(min_size=8)})),
+    biblio=st.fixed_dictionaries({"volume": st.text(),
+                                  "first_page": st.text(), "last_page": st.text()}),
+    topics=st.lists(st.fixed_dictionaries({
+        "topic_id": ID, "score": st.floats()})),
+    concepts=st.lists(st.fixed_dictionaries({
+        "concept_id": ID, "score": st.floats()})),
+    mesh=st.lists(st.fixed_dictionaries({
+        "descriptor_ui": ID, "descriptor_name": st.text(min_size=1),
+        "is_major_topic": st.booleans(), "qualifier_ui": st.text()})),
+    locations=st.lists(st.fixed_dictionaries({
+        "source_id": ID, "pdf_url": provisional.urls(),
+        "version": st.sampled_from(
+            ["publishedVersion", "acceptedVersion", "submittedVersion"])})),
+    open_access=st.fixed_dictionaries({"is_oa": st.booleans(),
+                                       "oa_status": ID}),
+    referenced_works=st.lists(st.text(alphabet=ID_CHARS, min_size=5, max_size=32)),
+    related_works=st.lists(st.text(alphabet=ID_CHARS, min_size=5, max_size=32)),
 )
 def test_work(
     id_: str,
@@ -126,21 +282,198 @@ def test_work(
     )
     assert w.id == id_
     assert w.ids.work_id == id_
-    for concept in w.concepts:
-        assert concept.work_id == id_
-    for topic in w.topics:
-        assert topic.work_id == id_
-    for authorship in w.authorships:
-        assert authorship.work_id == id_
-    for location in w.locations:
-        assert location.work_id == id_
-    for m in w.mesh:
-        assert m.work_id == id_
+    assert _all_wid(w.concepts, id_)
+    assert _all_wid(w.topics, id_)
+    assert _all_wid(w.authorships, id_)
+    assert _all_wid(w.locations, id_)
+    assert _all_wid(w.mesh, id_)
     assert w.biblio.work_id == id_
-    for related_work in w.related_works:
-        assert related_work.work_id == id_
-        assert isinstance(related_work.related_work_id, str)
-    for referenced_work in w.referenced_works:
-        assert referenced_work.work_id == id_
-        assert isinstance(referenced_work.referenced_work_id, str)
+    assert _all_wid(w.related_works, id_)
+    assert _all_wid(w.referenced_works, id_)
     assert w.open_access.work_id == id_
+
+
+_WORK_DICT = st.fixed_dictionaries({
+    "id": ID,
+    "doi": ID,
+    "title": st.one_of(st.none(), st.text(min_size=1)),
+    "publication_year": st.one_of(st.none(), YEAR),
+    "authorships": st.lists(st.fixed_dictionaries({
+        "author_id": ID,
+        "author_position": st.sampled_from(["first", "middle", "last"])}), max_size=4),
+    "concepts": st.lists(st.fixed_dictionaries({
+        "concept_id": ID, "score": st.floats(allow_nan=False)}), max_size=4),
+    "referenced_works": st.lists(ID, max_size=4),
+})
+
+
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(works=st.lists(_WORK_DICT, min_size=4, max_size=8))
+def test_work_batch(works: list[dict]):
+    """Test validating a batch of Works with one TypeAdapter call."""
+    expected = [(w["id"], list(w["referenced_works"])) for w in works]
+    validated = _WORKS_TA.validate_python(works)
+    assert len(validated) == len(expected)
+    for w, (id_, referenced_works) in zip(validated, expected):
+        assert isinstance(w, Work)
+        assert w.id == id_
+        assert _all_wid(w.authorships, id_)
+        assert _all_wid(w.concepts, id_)
+        assert [r.referenced_work_id for r in w.referenced_works] == referenced_works
+
+
+_WORK_ROW = ("W1", "10.1/x", "A title", "A title", 2020, datetime(2020, 1, 2),
+             "article", 3, False, False, None, "An abstract", "en")
+# subtable rows as read from SQL, in `_sql_order`, work_id first; None where
+# from_sql has to replicate it
+_SUBTABLE_ROWS = {
+    "locations": [(None, "S1", None, None, True, "publishedVersion", None),
+                  (None, "S2", None, None, False, None, None)],
+    "biblio": (None, "1", "2", "10", "20"),
+    "authorships": [(None, "first", "A1", "I1", None)],
+    "referenced_works": [("W1", "W2"), ("W1", "W3")],
+    "related_works": [("W1", "W4")],
+}
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_sql_subtables(trusted):
+    """Test from_sql with subtables already queried, validated or trusted."""
+    work = Work.from_sql(_WORK_ROW, subtables=_SUBTABLE_ROWS, trusted=trusted)
+    assert (work.id, work.publication_date, work.abstract) == (
+        "W1", datetime(2020, 1, 2), "An abstract")
+    # multi and single subtables, work_id replicated
+    assert all(isinstance(x, WorkLocation) for x in work.locations)
+    assert [x.source_id for x in work.locations] == ["S1", "S2"]
+    assert _all_wid(work.locations, "W1")
+    assert _all_wid(work.authorships, "W1")
+    assert isinstance(work.biblio, WorkBiblio)
+    assert (work.biblio.work_id, work.biblio.first_page) == ("W1", "10")
+    assert work.ids is None
+    # referenced and related works from their (work_id, other_id) rows
+    assert all(isinstance(x, WorkReferencedWork) for x in work.referenced_works)
+    assert [x.referenced_work_id for x in work.referenced_works] == ["W2", "W3"]
+    assert _all_wid(work.referenced_works, "W1")
+    assert [x.related_work_id for x in work.related_works] == ["W4"]
+    assert _all_wid(work.related_works, "W1")
+
+
+def test_from_sql_paths_agree():
+    """Test the trusted and validated paths build the same Work."""
+    for subtables in (None, _SUBTABLE_ROWS):
+        assert Work.from_sql(_WORK_ROW, subtables=subtables, trusted=True).model_dump() \
+            == Work.from_sql(_WORK_ROW, subtables=subtables).model_dump()
+
+
+def test_from_sql_trusted_skips_validation():
+    """Test only the untrusted path validates the subtables."""
+    bad = {"topics": [(None, "T1", "not a score")]}
+    with pytest.raises(ValidationError):
+        Work.from_sql(_WORK_ROW, subtables=bad)
+    assert Work.from_sql(_WORK_ROW, subtables=bad, trusted=True).topics[0].score == "not a score"
+
+
+def test_from_sql_context():
+    """Test _preprocess is skipped for the from_sql context object only.
+
+    Validated subtable models would make _preprocess reject referenced_works.
+    """
+    args = {"id": "W1", "referenced_works": [
+        WorkReferencedWork(work_id="W1", referenced_work_id="W2")]}
+    work = Work.model_validate(dict(args), context=_FROM_SQL_CONTEXT)
+    assert work.referenced_works[0].referenced_work_id == "W2"
+    with pytest.raises(ValidationError):
+        Work.model_validate(dict(args), context=dict(_FROM_SQL_CONTEXT))
+
+
+class _StubCopy:
+    """COPY block recording the rows written."""
+
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class _StubCursor:
+    """Cursor serving canned rows per query and recording COPY rows."""
+
+    def __init__(self, results: Mapping = MappingProxyType({})):
+        self.results = results
+        self.rows: list = []
+        self.copies: dict[str, list] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        self.rows = list(self.results.get(query, ()))
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def copy(self, statement: str) -> _StubCopy:
+        return _StubCopy(self.copies.setdefault(statement, []))
+
+
+class _StubConn:
+    """Connection handing out one stub cursor."""
+
+    def __init__(self, cursor: _StubCursor):
+        self._cursor = cursor
+
+    def cursor(self, **_):
+        return self._cursor
+
+
+def test_from_sql_batch():
+    """Test subtable rows of a batch are grouped by work_id, Works in ids order."""
+    w2 = ("W2",) + _WORK_ROW[1:]
+    location = ("S1", None, None, True, None, None)
+    cursor = _StubCursor({
+        _WORK_BATCH_QUERY: [_WORK_ROW, w2],
+        _SUBTABLE_BATCH_QUERIES["locations"]: [
+            ("W1", *location), ("W2", *location), ("W1", "S2", *location[1:])],
+        _SUBTABLE_BATCH_QUERIES["biblio"]: [("W2", "1", None, None, None)],
+        _SUBTABLE_BATCH_QUERIES["referenced_works"]: [
+            ("W2", "W9"), ("W1", "W7"), ("W1", "W8")],
+    })
+    works = Work.from_sql_batch(["W2", "W3", "W1"], _StubConn(cursor))
+    assert [w.id for w in works] == ["W2", "W1"]
+    w2_, w1_ = works
+    assert [x.source_id for x in w1_.locations] == ["S1", "S2"]
+    assert [x.source_id for x in w2_.locations] == ["S1"]
+    assert (w1_.biblio, w2_.biblio.volume) == (None, "1")
+    assert [x.referenced_work_id for x in w1_.referenced_works] == ["W7", "W8"]
+    assert [x.referenced_work_id for x in w2_.referenced_works] == ["W9"]
+    assert _all_wid(w1_.locations, "W1") and _all_wid(w2_.locations, "W2")
+
+
+def test_bulk_insert():
+    """Test rows of all Works are gathered into one COPY per table, parent first."""
+    works = [Work(id=id_, locations=[{"source": {"id": "S1"}}, {"source": {"id": "S2"}}],
+                  referenced_works=["W9"])
+             for id_ in ("W1", "W2")]
+    cursor = _StubCursor()
+    Work.bulk_insert(works, _StubConn(cursor))
+    statements = list(cursor.copies)
+    assert statements[0] == f"COPY openalex.works {Work._sql_columns_str} FROM STDIN"
+    assert [row[0] for row in cursor.copies[statements[0]]] == ["W1", "W2"]
+    locations = cursor.copies[
+        f"COPY openalex.works_locations {WorkLocation._sql_columns_str} FROM STDIN"]
+    assert [row[:2] for row in locations] == [
+        ("W1", "S1"), ("W1", "S2"), ("W2", "S1"), ("W2", "S2")]
+    referenced = cursor.copies[
+        f"COPY openalex.works_referenced_works {WorkReferencedWork._sql_columns_str} "
+        "FROM STDIN"]
+    assert referenced == [("W1", "W9"), ("W2", "W9")]